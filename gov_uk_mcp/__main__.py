@@ -0,0 +1,5 @@
+"""Entry point for ``python -m gov_uk_mcp``."""
+
+from gov_uk_mcp.server import main
+
+main()
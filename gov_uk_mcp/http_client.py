@@ -0,0 +1,58 @@
+"""HTTP helpers for async tools.
+
+FastMCP serves every tool call from a single event loop. A blocking
+requests.get inside an async tool would stall every other call until the
+upstream API answered, so async tools await these helpers instead: the
+request runs in a worker thread while the event loop keeps serving.
+All requests share one Session, so repeat calls to the same API reuse
+pooled keep-alive connections instead of a new TCP and TLS handshake.
+Response bodies are decoded with orjson when it is installed.
+"""
+
+import asyncio
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Pool size covers the tool calls FastMCP can have in flight in worker
+# threads. Only connection failures are retried: the request never reached
+# the server, and a read retry would double the caller's timeout.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+    ),
+)
+
+
+async def get(url: str, **kwargs: Any) -> requests.Response:
+    """Perform a GET on the shared session in a worker thread.
+
+    Accepts the same arguments as requests.get and raises the same
+    requests exceptions, so callers keep their existing error handling.
+    """
+    return await asyncio.to_thread(_SESSION.get, url, **kwargs)
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a response body as JSON, using orjson when it is installed.
+
+    Decode errors are raised as requests.JSONDecodeError either way, so the
+    tools' requests.RequestException handlers still catch them.
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
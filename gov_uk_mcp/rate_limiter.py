@@ -8,15 +8,51 @@ The token bucket algorithm allows for burst traffic while maintaining average ra
 making it ideal for API rate limiting scenarios.
 """
 
+import asyncio
 import time
 import threading
-from typing import Dict, Optional, Tuple, Callable, Any
-from dataclasses import dataclass, field
-from functools import wraps
+from collections.abc import Mapping
+from typing import Dict, Optional, Tuple, Callable, Any, Union
+from functools import lru_cache, wraps
 from datetime import datetime, timedelta
 
 
-@dataclass
+_NS_PER_SEC = 1_000_000_000
+_NS_PER_MIN = 60 * _NS_PER_SEC
+
+# Token counts are held internally as integer millitokens
+_MILLI = 1000
+
+# Bound once so the hot path does a global lookup instead of a module attribute lookup
+_monotonic_ns = time.monotonic_ns
+
+# Offset between the monotonic clock and the Unix epoch, captured once at import.
+# Bucket arithmetic runs on monotonic_ns() (immune to NTP/wall-clock jumps);
+# this converts back to a Unix timestamp only where a reset time is reported.
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _to_unix_time(monotonic_ns: int) -> float:
+    """Convert a monotonic_ns() reading to a Unix timestamp in seconds."""
+    return (monotonic_ns + _EPOCH_OFFSET_NS) / _NS_PER_SEC
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    """Format a whole Unix second as an ISO timestamp."""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """ISO timestamp for the current second, formatted at most once per second."""
+    return _iso_for_second(int(time.time()))
+
+
+def _retry_after_seconds(wait_ns: int) -> int:
+    """Whole seconds a rejected caller should wait before retrying (rounded up)."""
+    return (wait_ns + _NS_PER_SEC - 1) // _NS_PER_SEC
+
+
 class TokenBucket:
     """Token bucket for rate limiting using the token bucket algorithm.
 
@@ -24,31 +60,83 @@ class TokenBucket:
     refilling tokens at a constant rate. This provides smooth rate limiting
     while allowing temporary bursts of traffic.
 
+    Internally tokens are held as integer millitokens and the refill rate as
+    millitokens per minute, so all bucket arithmetic is integer and exact for
+    whole requests-per-minute limits. Token counts are converted back to floats
+    only where they are reported.
+
+    The mutable state ``(tokens, last_refill)`` is packed into a single tuple so
+    readers always see a consistent snapshot and writers publish a new state
+    with one attribute store. ``consume`` and ``reset`` take the lock (so
+    consume's read-modify-write cannot overwrite a reset); ``peek`` works from
+    a snapshot without locking.
+
     Attributes:
         capacity: Maximum number of tokens (requests) the bucket can hold
-        tokens: Current number of available tokens
+        tokens: Number of available tokens as of the last refill
         rate: Number of tokens added per second
-        last_refill: Timestamp of last token refill
-        lock: Thread lock for concurrent access safety
+        last_refill: Monotonic timestamp (ns) of last token refill
+        lock: Thread lock serialising consume() updates
     """
-    capacity: float
-    tokens: float
-    rate: float  # tokens per second
-    last_refill: float = field(default_factory=time.time)
-    lock: threading.Lock = field(default_factory=threading.Lock)
 
-    def _refill(self) -> None:
-        """Refill tokens based on time elapsed since last refill.
+    __slots__ = ("capacity", "rate", "_capacity_milli", "_rate_milli", "_state", "lock")
+
+    def __init__(
+        self,
+        capacity: float,
+        tokens: float,
+        rate: float,
+        last_refill: Optional[int] = None,
+    ):
+        self.capacity = capacity
+        self.rate = rate  # tokens per second
+        self._capacity_milli = round(capacity * _MILLI)
+        self._rate_milli = round(rate * 60 * _MILLI)  # millitokens per minute
+        self._state: Tuple[int, int] = (
+            round(tokens * _MILLI),
+            _monotonic_ns() if last_refill is None else last_refill,
+        )
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenBucket(capacity={self.capacity!r}, tokens={self.tokens!r}, "
+            f"rate={self.rate!r}, last_refill={self.last_refill!r})"
+        )
+
+    @property
+    def tokens(self) -> float:
+        """Number of available tokens as of the last refill."""
+        return self._state[0] / _MILLI
+
+    @property
+    def last_refill(self) -> int:
+        """Monotonic timestamp (ns) of the last token refill."""
+        return self._state[1]
+
+    def _refill(self, now: int) -> int:
+        """Compute the millitoken count at ``now`` from the current state snapshot.
+
+        This does not modify the bucket; callers publish the result themselves.
+
+        Args:
+            now: Current monotonic timestamp in nanoseconds
 
-        This method should only be called while holding the lock.
+        Returns:
+            Number of millitokens available at ``now``, capped at capacity
         """
-        now = time.time()
-        elapsed = now - self.last_refill
+        tokens, last_refill = self._state
+        elapsed_ns = now - last_refill
 
         # Add tokens based on elapsed time
-        new_tokens = elapsed * self.rate
-        self.tokens = min(self.capacity, self.tokens + new_tokens)
-        self.last_refill = now
+        return min(
+            self._capacity_milli,
+            tokens + elapsed_ns * self._rate_milli // _NS_PER_MIN,
+        )
+
+    def _ns_to_accrue(self, milli: int) -> int:
+        """Nanoseconds needed to accrue ``milli`` millitokens (rounded up)."""
+        return -(-milli * _NS_PER_MIN // self._rate_milli)
 
     def consume(self, tokens: float = 1.0) -> Tuple[bool, float, float]:
         """Attempt to consume tokens from the bucket.
@@ -62,22 +150,73 @@ class TokenBucket:
                 - remaining_tokens: Number of tokens remaining after consumption
                 - reset_time: Unix timestamp when bucket will be full
         """
+        return self._consume(tokens)[:3]
+
+    def _consume(self, tokens: float = 1.0) -> Tuple[bool, float, float, int]:
+        """consume(), additionally returning the wait in nanoseconds.
+
+        Returns:
+            Tuple of (success, remaining_tokens, reset_time, wait_ns) where
+            wait_ns is how long until ``tokens`` will be available (0 if the
+            tokens were consumed)
+        """
+        needed = round(tokens * _MILLI)
+
+        # Hot path: attributes are read into locals once and the refill is
+        # inlined rather than going through _refill()
+        capacity = self._capacity_milli
+        rate = self._rate_milli
         with self.lock:
-            self._refill()
+            now = _monotonic_ns()
+            stored, last_refill = self._state
+            # Millitokens accrued since last_refill, scaled by _NS_PER_MIN
+            accrued_scaled = (now - last_refill) * rate
+
+            # Below capacity, if the stored tokens already cover the request and
+            # less than one whole token has accrued, debit without refilling.
+            # last_refill is left untouched so the accrued fraction is credited
+            # by a later refill, and the reset time is measured from it.
+            if needed <= stored < capacity and accrued_scaled < _MILLI * _NS_PER_MIN:
+                remaining = stored - needed
+                self._state = (remaining, last_refill)
+                full_ns = self._ns_to_accrue(capacity - remaining)
+                return True, remaining / _MILLI, _to_unix_time(last_refill + full_ns), 0
+
+            # last_refill advances only by the time that was actually
+            # credited, so the fraction of a millitoken lost to the floor
+            # division keeps accruing. Dropping it would starve a caller that
+            # polls faster than one millitoken accrues. A full bucket discards
+            # the surplus and restarts from now.
+            credited = accrued_scaled // _NS_PER_MIN
+            available = stored + credited
+            if available >= capacity:
+                available = capacity
+                refilled_at = now
+            else:
+                refilled_at = last_refill + self._ns_to_accrue(credited)
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                remaining = self.tokens
+            if available >= needed:
+                available -= needed
+                self._state = (available, refilled_at)
                 # Calculate when bucket will be full
-                time_to_full = (self.capacity - self.tokens) / self.rate
-                reset_time = time.time() + time_to_full
-                return True, remaining, reset_time
+                full_ns = self._ns_to_accrue(capacity - available)
+                reset_time = _to_unix_time(now + full_ns)
+                return True, available / _MILLI, reset_time, 0
             else:
+                self._state = (available, refilled_at)
                 # Calculate how long until we have enough tokens
-                tokens_needed = tokens - self.tokens
-                wait_time = tokens_needed / self.rate
-                reset_time = time.time() + wait_time
-                return False, self.tokens, reset_time
+                wait_ns = self._ns_to_accrue(needed - available)
+                reset_time = _to_unix_time(now + wait_ns)
+                return False, available / _MILLI, reset_time, wait_ns
+
+    def reset(self) -> None:
+        """Refill the bucket to capacity.
+
+        Takes the lock so a consume() that read the state before the reset
+        cannot publish its stale result afterwards and undo it.
+        """
+        with self.lock:
+            self._state = (self._capacity_milli, _monotonic_ns())
 
     def peek(self) -> Tuple[float, float]:
         """Check current token count without consuming.
@@ -87,11 +226,84 @@ class TokenBucket:
                 - available_tokens: Current number of tokens
                 - reset_time: Unix timestamp when bucket will be full
         """
-        with self.lock:
-            self._refill()
-            time_to_full = (self.capacity - self.tokens) / self.rate
-            reset_time = time.time() + time_to_full
-            return self.tokens, reset_time
+        now = _monotonic_ns()
+        available = self._refill(now)
+        full_ns = self._ns_to_accrue(self._capacity_milli - available)
+        reset_time = _to_unix_time(now + full_ns)
+        return available / _MILLI, reset_time
+
+
+class RateLimitInfo(Mapping):
+    """Rate limit information for a single check_limit() call.
+
+    Behaves as a read-only dictionary with the keys ``remaining``, ``limit``,
+    ``reset_time`` and, when the request was rejected, ``retry_after``. The ISO
+    ``reset_time`` string is only formatted the first time it is read, since
+    most callers never look at it.
+
+    Attributes:
+        remaining: Number of requests remaining
+        limit: Maximum requests per minute
+        retry_after: Seconds to wait before retry (None if the request was allowed)
+    """
+
+    __slots__ = ("remaining", "limit", "retry_after", "_reset_ts", "_reset_iso")
+
+    _KEYS = ("remaining", "reset_time", "limit")
+    _KEYS_WITH_RETRY = _KEYS + ("retry_after",)
+
+    def __init__(
+        self,
+        remaining: int,
+        limit: int,
+        reset_ts: float,
+        retry_after: Optional[int] = None,
+    ):
+        self.remaining = remaining
+        self.limit = limit
+        self.retry_after = retry_after
+        self._reset_ts = reset_ts
+        self._reset_iso: Optional[str] = None
+
+    @property
+    def reset_time(self) -> str:
+        """ISO timestamp when the limit resets (formatted on first access)."""
+        if self._reset_iso is None:
+            self._reset_iso = datetime.fromtimestamp(self._reset_ts).isoformat()
+        return self._reset_iso
+
+    def _keys(self) -> Tuple[str, ...]:
+        return self._KEYS if self.retry_after is None else self._KEYS_WITH_RETRY
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._keys():
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        # Avoid Mapping's default, which would format reset_time via __getitem__
+        return key in self._keys()
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"RateLimitInfo({dict(self)!r})"
+
+
+def _make_info(
+    success: bool, remaining: float, reset_time: float, limit: float, wait_ns: int
+) -> RateLimitInfo:
+    """Build the RateLimitInfo for a consume() result."""
+    return RateLimitInfo(
+        remaining=int(remaining),
+        limit=int(limit),
+        reset_ts=reset_time,
+        retry_after=None if success else _retry_after_seconds(wait_ns),
+    )
 
 
 class RateLimiter:
@@ -119,10 +331,36 @@ class RateLimiter:
         "default": 60,                # Default: 60 req/min for other APIs
     }
 
-    def __init__(self):
-        """Initialize the rate limiter with empty bucket storage."""
-        self._buckets: Dict[str, TokenBucket] = {}
-        self._lock = threading.Lock()
+    # Default refill rates in tokens per second, precomputed from DEFAULT_LIMITS
+    _DEFAULT_RATES = {key: limit / 60.0 for key, limit in DEFAULT_LIMITS.items()}
+
+    # Buckets are spread over independently locked shards so that creating
+    # buckets for different endpoints does not serialise on one lock.
+    # Must be a power of two.
+    _NUM_SHARDS = 32
+
+    # Idle buckets in a shard are swept each time its size reaches a multiple of this
+    _SWEEP_INTERVAL = 64
+
+    def __init__(self, idle_ttl: Optional[float] = 300.0):
+        """Initialize the rate limiter with empty bucket storage.
+
+        Args:
+            idle_ttl: Seconds a bucket may go without a refill before it can be
+                      evicted once it has refilled to capacity. Endpoints named
+                      in DEFAULT_LIMITS are never evicted. None disables eviction.
+        """
+        self._idle_ttl_ns = None if idle_ttl is None else int(idle_ttl * _NS_PER_SEC)
+        self._shards: Tuple[Dict[str, TokenBucket], ...] = tuple(
+            {} for _ in range(self._NUM_SHARDS)
+        )
+        self._shard_locks: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(self._NUM_SHARDS)
+        )
+
+    def _shard_index(self, endpoint: str) -> int:
+        """Return the index of the shard holding an endpoint's bucket."""
+        return hash(endpoint) & (self._NUM_SHARDS - 1)
 
     def _get_bucket(self, endpoint: str, requests_per_minute: Optional[int] = None) -> TokenBucket:
         """Get or create a token bucket for an endpoint.
@@ -135,36 +373,100 @@ class RateLimiter:
         Returns:
             TokenBucket instance for the endpoint
         """
-        with self._lock:
-            if endpoint not in self._buckets:
-                # Determine rate limit
+        index = self._shard_index(endpoint)
+        shard = self._shards[index]
+
+        # Fast path: dict.get is atomic, so existing buckets can be returned
+        # without taking the lock. Buckets are only evicted once idle and full,
+        # so a caller racing an eviction can at worst be granted one token from
+        # the bucket being dropped.
+        bucket = shard.get(endpoint)
+        if bucket is not None:
+            return bucket
+
+        with self._shard_locks[index]:
+            # Re-check under the lock in case another thread created it first
+            bucket = shard.get(endpoint)
+            if bucket is None:
+                # Determine rate limit and convert to requests per second
                 if requests_per_minute is None:
                     requests_per_minute = self.DEFAULT_LIMITS.get(
                         endpoint,
                         self.DEFAULT_LIMITS["default"]
                     )
-
-                # Convert to requests per second
-                rate = requests_per_minute / 60.0
+                    rate = self._DEFAULT_RATES.get(endpoint, self._DEFAULT_RATES["default"])
+                else:
+                    rate = requests_per_minute / 60.0
 
                 # Create bucket with capacity equal to rate
                 # This allows burst up to the per-minute limit
-                self._buckets[endpoint] = TokenBucket(
+                bucket = TokenBucket(
                     capacity=requests_per_minute,
                     tokens=requests_per_minute,  # Start full
                     rate=rate
                 )
+                shard[endpoint] = bucket
+
+                if self._idle_ttl_ns is not None and len(shard) % self._SWEEP_INTERVAL == 0:
+                    self._evict_idle(shard)
+
+            return bucket
+
+    def _evict_idle(self, shard: Dict[str, TokenBucket]) -> None:
+        """Drop idle, fully refilled buckets from a shard.
+
+        A full bucket behaves exactly like a newly created one, so dropping it
+        only bounds memory for high-cardinality endpoint keys. The caller must
+        hold the shard's lock.
+
+        Args:
+            shard: Shard to sweep
+        """
+        now = _monotonic_ns()
+        idle = [
+            endpoint
+            for endpoint, bucket in shard.items()
+            if endpoint not in self.DEFAULT_LIMITS
+            and now - bucket.last_refill > self._idle_ttl_ns
+            and bucket._refill(now) >= bucket._capacity_milli
+        ]
+        for endpoint in idle:
+            del shard[endpoint]
+
+    def check_limit_fast(
+        self,
+        endpoint: str,
+        requests_per_minute: Optional[int] = None,
+        tokens: float = 1.0
+    ) -> Tuple[bool, float, float, float, int]:
+        """Check if a request is allowed, returning raw values without allocating a mapping.
 
-            return self._buckets[endpoint]
+        Args:
+            endpoint: Unique identifier for the endpoint
+            requests_per_minute: Optional custom rate limit
+            tokens: Number of tokens to consume (default: 1.0)
+
+        Returns:
+            Tuple of (allowed, remaining, reset_time, limit, wait_ns) where
+            reset_time is a Unix timestamp and wait_ns is the nanoseconds until
+            the request could succeed (0 if allowed)
+        """
+        bucket = self._get_bucket(endpoint, requests_per_minute)
+        success, remaining, reset_time, wait_ns = bucket._consume(tokens)
+        return success, remaining, reset_time, bucket.capacity, wait_ns
 
     def check_limit(
         self,
         endpoint: str,
         requests_per_minute: Optional[int] = None,
         tokens: float = 1.0
-    ) -> Tuple[bool, Dict[str, Any]]:
+    ) -> Tuple[bool, RateLimitInfo]:
         """Check if a request is allowed under rate limit.
 
+        A burst of n requests is checked with tokens=n: the bucket lock and
+        clock are taken once, and the check is all-or-nothing (nothing is
+        debited if fewer than n tokens are available).
+
         Args:
             endpoint: Unique identifier for the endpoint
             requests_per_minute: Optional custom rate limit
@@ -173,26 +475,45 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, info) where:
                 - allowed: Boolean indicating if request is allowed
-                - info: Dictionary with rate limit information:
+                - info: RateLimitInfo mapping with rate limit information:
                     - remaining: Number of requests remaining
-                    - reset_time: ISO timestamp when limit resets
+                    - reset_time: ISO timestamp when limit resets (formatted lazily)
+                    - limit: Maximum requests per minute
                     - retry_after: Seconds to wait before retry (if not allowed)
         """
-        bucket = self._get_bucket(endpoint, requests_per_minute)
-        success, remaining, reset_time = bucket.consume(tokens)
+        success, remaining, reset_time, limit, wait_ns = self.check_limit_fast(
+            endpoint, requests_per_minute, tokens
+        )
+        return success, _make_info(success, remaining, reset_time, limit, wait_ns)
 
-        reset_datetime = datetime.fromtimestamp(reset_time)
+    def try_wait(
+        self,
+        endpoint: str,
+        n: int = 1,
+        requests_per_minute: Optional[int] = None
+    ) -> Optional[float]:
+        """Try to consume ``n`` tokens, returning how long to wait if rejected.
 
-        info = {
-            "remaining": int(remaining),
-            "reset_time": reset_datetime.isoformat(),
-            "limit": int(bucket.capacity),
-        }
+        Args:
+            endpoint: Unique identifier for the endpoint
+            n: Number of tokens to consume (default: 1)
+            requests_per_minute: Optional custom rate limit
 
-        if not success:
-            info["retry_after"] = int(reset_time - time.time()) + 1
+        Returns:
+            None if the tokens were consumed, otherwise the number of seconds
+            until enough tokens will be available
 
-        return success, info
+        Raises:
+            ValueError: If ``n`` exceeds the bucket capacity, since no wait
+                        would ever make that many tokens available
+        """
+        bucket = self._get_bucket(endpoint, requests_per_minute)
+        if n > bucket.capacity:
+            raise ValueError(f"n={n} exceeds the {endpoint} bucket capacity of {bucket.capacity}")
+        allowed, _, _, wait_ns = bucket._consume(n)
+        if allowed:
+            return None
+        return wait_ns / _NS_PER_SEC
 
     def get_status(self, endpoint: str) -> Dict[str, Any]:
         """Get current rate limit status for an endpoint.
@@ -206,23 +527,28 @@ class RateLimiter:
                 - limit: Maximum requests per minute
                 - reset_time: ISO timestamp when limit resets to full
         """
-        with self._lock:
-            if endpoint not in self._buckets:
-                # Return default limit info if bucket doesn't exist yet
-                limit = self.DEFAULT_LIMITS.get(endpoint, self.DEFAULT_LIMITS["default"])
-                return {
-                    "available": limit,
-                    "limit": limit,
-                    "reset_time": datetime.now().isoformat()
-                }
-
-        bucket = self._buckets[endpoint]
+        bucket = self._shards[self._shard_index(endpoint)].get(endpoint)
+        if bucket is None:
+            # Return default limit info if bucket doesn't exist yet
+            limit = self.DEFAULT_LIMITS.get(endpoint, self.DEFAULT_LIMITS["default"])
+            return {
+                "available": limit,
+                "limit": limit,
+                "reset_time": _now_iso()
+            }
+
         available, reset_time = bucket.peek()
 
+        # A full bucket resets "now"; reuse the per-second cached timestamp
+        if available >= bucket.capacity:
+            reset_iso = _now_iso()
+        else:
+            reset_iso = datetime.fromtimestamp(reset_time).isoformat()
+
         return {
             "available": int(available),
             "limit": int(bucket.capacity),
-            "reset_time": datetime.fromtimestamp(reset_time).isoformat()
+            "reset_time": reset_iso
         }
 
     def reset(self, endpoint: Optional[str] = None) -> None:
@@ -231,29 +557,54 @@ class RateLimiter:
         Args:
             endpoint: Specific endpoint to reset, or None to reset all
         """
-        with self._lock:
-            if endpoint:
-                if endpoint in self._buckets:
-                    bucket = self._buckets[endpoint]
-                    with bucket.lock:
-                        bucket.tokens = bucket.capacity
-                        bucket.last_refill = time.time()
-            else:
-                # Reset all buckets
-                for bucket in self._buckets.values():
-                    with bucket.lock:
-                        bucket.tokens = bucket.capacity
-                        bucket.last_refill = time.time()
+        if endpoint:
+            bucket = self._shards[self._shard_index(endpoint)].get(endpoint)
+            if bucket is not None:
+                bucket.reset()
+        else:
+            # Reset all buckets; the shard lock only guards iteration against
+            # concurrent bucket creation or eviction
+            for shard, shard_lock in zip(self._shards, self._shard_locks):
+                with shard_lock:
+                    for bucket in shard.values():
+                        bucket.reset()
 
 
 # Global rate limiter instance
 _global_limiter = RateLimiter()
 
 
+def _rate_limited_response(
+    endpoint: str, reset_time: float, limit: float, wait_ns: int
+) -> Dict[str, Any]:
+    """Build the error dictionary returned when a decorated call is rate limited."""
+    retry_after = _retry_after_seconds(wait_ns)
+    return {
+        "error": f"Rate limit exceeded for {endpoint}",
+        "error_type": "rate_limit_exceeded",
+        "retry_after": retry_after,
+        "reset_time": datetime.fromtimestamp(reset_time).isoformat(),
+        "limit": int(limit),
+        "message": f"Please retry after {retry_after} seconds"
+    }
+
+
+def _add_rate_limit_info(result: Any, remaining: float, reset_time: float, limit: float) -> Any:
+    """Attach rate limit info to a successful dictionary result."""
+    if isinstance(result, dict) and "error" not in result:
+        result["rate_limit"] = {
+            "remaining": int(remaining),
+            "limit": int(limit),
+            "reset_time": datetime.fromtimestamp(reset_time).isoformat()
+        }
+    return result
+
+
 def rate_limit(
     endpoint: str,
     requests_per_minute: Optional[int] = None,
-    limiter: Optional[RateLimiter] = None
+    limiter: Optional[RateLimiter] = None,
+    weight: Union[int, Callable[..., int]] = 1
 ) -> Callable:
     """Decorator to apply rate limiting to tool functions.
 
@@ -264,6 +615,9 @@ def rate_limit(
         endpoint: Unique identifier for the endpoint being rate limited
         requests_per_minute: Optional custom rate limit (default: uses endpoint default)
         limiter: Optional custom RateLimiter instance (default: uses global limiter)
+        weight: Tokens consumed per call, or a callable receiving the call's
+                arguments and returning the token count (default: 1). Weighted
+                calls are all-or-nothing, as with check_limit(..., tokens=n).
 
     Returns:
         Decorator function that wraps the tool function
@@ -273,6 +627,9 @@ def rate_limit(
         ... def check_mot(registration):
         ...     # API call here
         ...     pass
+        >>> @rate_limit("mot_api", weight=lambda registrations: len(registrations))
+        ... def check_mot_bulk(registrations):
+        ...     pass
     """
     if limiter is None:
         limiter = _global_limiter
@@ -280,35 +637,85 @@ def rate_limit(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Dict[str, Any]:
-            # Check rate limit
-            allowed, info = limiter.check_limit(endpoint, requests_per_minute)
+            tokens = weight(*args, **kwargs) if callable(weight) else weight
+
+            # Check rate limit; response dicts are only built when needed
+            allowed, remaining, reset_time, limit, wait_ns = limiter.check_limit_fast(
+                endpoint, requests_per_minute, tokens
+            )
 
             if not allowed:
                 # Rate limit exceeded - return error with retry information
-                retry_after = info.get("retry_after", 60)
-                reset_time = info.get("reset_time", "")
-
-                return {
-                    "error": f"Rate limit exceeded for {endpoint}",
-                    "error_type": "rate_limit_exceeded",
-                    "retry_after": retry_after,
-                    "reset_time": reset_time,
-                    "limit": info.get("limit"),
-                    "message": f"Please retry after {retry_after} seconds"
-                }
+                return _rate_limited_response(endpoint, reset_time, limit, wait_ns)
 
             # Rate limit OK - call the original function
             result = func(*args, **kwargs)
 
             # Add rate limit info to successful responses
-            if isinstance(result, dict) and "error" not in result:
-                result["rate_limit"] = {
-                    "remaining": info.get("remaining"),
-                    "limit": info.get("limit"),
-                    "reset_time": info.get("reset_time")
-                }
+            return _add_rate_limit_info(result, remaining, reset_time, limit)
 
-            return result
+        return wrapper
+    return decorator
+
+
+def rate_limit_async(
+    endpoint: str,
+    requests_per_minute: Optional[int] = None,
+    limiter: Optional[RateLimiter] = None,
+    weight: Union[int, Callable[..., int]] = 1,
+    max_retries: int = 3
+) -> Callable:
+    """Decorator to apply rate limiting to async tool functions.
+
+    Unlike rate_limit(), a rejected call is not failed straight away: the
+    wrapper sleeps for exactly as long as the bucket needs to refill and tries
+    again, returning the rate limit error dictionary only once ``max_retries``
+    retries have been exhausted. A call weighing more than the bucket capacity
+    can never succeed, so it gets the error dictionary without waiting.
+
+    Args:
+        endpoint: Unique identifier for the endpoint being rate limited
+        requests_per_minute: Optional custom rate limit (default: uses endpoint default)
+        limiter: Optional custom RateLimiter instance (default: uses global limiter)
+        weight: Tokens consumed per call, or a callable receiving the call's
+                arguments and returning the token count (default: 1)
+        max_retries: Number of times to wait and retry before giving up (default: 3)
+
+    Returns:
+        Decorator function that wraps the async tool function
+
+    Raises:
+        ValueError: If max_retries is negative
+
+    Example:
+        >>> @rate_limit_async("tfl")
+        ... async def get_tube_status():
+        ...     pass
+    """
+    if max_retries < 0:
+        raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+    if limiter is None:
+        limiter = _global_limiter
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            tokens = weight(*args, **kwargs) if callable(weight) else weight
+
+            for attempt in range(max_retries + 1):
+                allowed, remaining, reset_time, limit, wait_ns = limiter.check_limit_fast(
+                    endpoint, requests_per_minute, tokens
+                )
+                if allowed:
+                    result = await func(*args, **kwargs)
+                    return _add_rate_limit_info(result, remaining, reset_time, limit)
+                if tokens > limit:
+                    # No amount of refilling makes this many tokens available
+                    break
+                if attempt < max_retries:
+                    await asyncio.sleep(wait_ns / _NS_PER_SEC)
+
+            return _rate_limited_response(endpoint, reset_time, limit, wait_ns)
 
         return wrapper
     return decorator
@@ -325,40 +732,57 @@ def get_limiter() -> RateLimiter:
 
 # Convenience functions for checking limits without decorator
 
-def check_mot_limit() -> Tuple[bool, Dict[str, Any]]:
+# The fixed API endpoints have their buckets created once at import so the
+# convenience checks below go straight to the bucket without a shard lookup
+_MOT_BUCKET = _global_limiter._get_bucket("mot_api", 120)
+_CH_BUCKET = _global_limiter._get_bucket("companies_house", 120)
+_TFL_BUCKET = _global_limiter._get_bucket("tfl", 500)
+
+
+def _check_bucket(bucket: TokenBucket) -> Tuple[bool, RateLimitInfo]:
+    """Consume one token from a pre-built bucket and report the result."""
+    success, remaining, reset_time, wait_ns = bucket._consume(1.0)
+    return success, _make_info(success, remaining, reset_time, bucket.capacity, wait_ns)
+
+
+def check_mot_limit() -> Tuple[bool, RateLimitInfo]:
     """Check MOT API rate limit (120 req/min).
 
     Returns:
-        Tuple of (allowed, info) with rate limit status
+        Tuple of (allowed, info) with rate limit status; info["reset_time"]
+        is formatted lazily on first access
     """
-    return _global_limiter.check_limit("mot_api", requests_per_minute=120)
+    return _check_bucket(_MOT_BUCKET)
 
 
-def check_companies_house_limit() -> Tuple[bool, Dict[str, Any]]:
+def check_companies_house_limit() -> Tuple[bool, RateLimitInfo]:
     """Check Companies House API rate limit (600 req/5min = 120 req/min).
 
     Returns:
-        Tuple of (allowed, info) with rate limit status
+        Tuple of (allowed, info) with rate limit status; info["reset_time"]
+        is formatted lazily on first access
     """
-    return _global_limiter.check_limit("companies_house", requests_per_minute=120)
+    return _check_bucket(_CH_BUCKET)
 
 
-def check_tfl_limit() -> Tuple[bool, Dict[str, Any]]:
+def check_tfl_limit() -> Tuple[bool, RateLimitInfo]:
     """Check TfL API rate limit (500 req/min).
 
     Returns:
-        Tuple of (allowed, info) with rate limit status
+        Tuple of (allowed, info) with rate limit status; info["reset_time"]
+        is formatted lazily on first access
     """
-    return _global_limiter.check_limit("tfl", requests_per_minute=500)
+    return _check_bucket(_TFL_BUCKET)
 
 
-def check_default_limit(endpoint: str) -> Tuple[bool, Dict[str, Any]]:
+def check_default_limit(endpoint: str) -> Tuple[bool, RateLimitInfo]:
     """Check default rate limit (60 req/min) for any endpoint.
 
     Args:
         endpoint: Unique identifier for the endpoint
 
     Returns:
-        Tuple of (allowed, info) with rate limit status
+        Tuple of (allowed, info) with rate limit status; info["reset_time"]
+        is formatted lazily on first access
     """
     return _global_limiter.check_limit(endpoint, requests_per_minute=60)
@@ -1,12 +1,23 @@
 """Bank holidays tool."""
 import requests
+from bisect import bisect_left
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from gov_uk_mcp import http_client
 from gov_uk_mcp.validation import sanitize_api_error
 
 
 BANK_HOLIDAYS_URL = "https://www.gov.uk/bank-holidays.json"
 
+# The bank holidays document changes a few times a year. Once it has been
+# fetched it is revalidated with a conditional GET, and a 304 reuses the
+# parsed payload instead of downloading and parsing it again. Each
+# division's events are sorted by date once per download and kept alongside,
+# so the upcoming holidays are a bisect and a slice.
+_BH_CACHE = {"etag": None, "last_modified": None, "payload": None, "events": None}
+
+_EventIndex = Dict[str, Tuple[List[dict], List[date]]]
+
 # Import mcp after defining constants to avoid circular import at module level
 def _get_mcp():
     from gov_uk_mcp.server import mcp
@@ -15,17 +26,67 @@ def _get_mcp():
 mcp = _get_mcp()
 
 
+def _index_events(data: dict) -> _EventIndex:
+    """Map each division to its events sorted by date and the parsed dates."""
+    index = {}
+    for country_key, country_data in data.items():
+        dated = sorted(
+            ((date.fromisoformat(event["date"]), event) for event in country_data.get("events", [])),
+            key=lambda pair: pair[0]
+        )
+        index[country_key] = ([event for _, event in dated], [event_date for event_date, _ in dated])
+    return index
+
+
+def _upcoming(index: _EventIndex, country_key: str, today: date) -> List[dict]:
+    """Return copies of the division's events falling on or after today.
+
+    The events are shared with the cached payload, so each is copied before it
+    is handed out. Event fields are all scalars, so a shallow copy suffices.
+    """
+    events, dates = index[country_key]
+    return [dict(event) for event in events[bisect_left(dates, today):]]
+
+
+async def _fetch_bank_holidays() -> Tuple[dict, _EventIndex]:
+    """Return the bank holidays document and its date-sorted event index.
+
+    Any cached copy is revalidated with a conditional GET first.
+    """
+    headers = {}
+    if _BH_CACHE["payload"] is not None:
+        if _BH_CACHE["etag"]:
+            headers["If-None-Match"] = _BH_CACHE["etag"]
+        if _BH_CACHE["last_modified"]:
+            headers["If-Modified-Since"] = _BH_CACHE["last_modified"]
+
+    response = await http_client.get(BANK_HOLIDAYS_URL, headers=headers, timeout=10)
+    if response.status_code == 304 and _BH_CACHE["payload"] is not None:
+        # A 304 may carry refreshed validators for the unchanged document
+        _BH_CACHE["etag"] = response.headers.get("ETag", _BH_CACHE["etag"])
+        _BH_CACHE["last_modified"] = response.headers.get(
+            "Last-Modified", _BH_CACHE["last_modified"]
+        )
+        return _BH_CACHE["payload"], _BH_CACHE["events"]
+
+    response.raise_for_status()
+    data = http_client.parse_json(response)
+    _BH_CACHE["etag"] = response.headers.get("ETag")
+    _BH_CACHE["last_modified"] = response.headers.get("Last-Modified")
+    _BH_CACHE["payload"] = data
+    _BH_CACHE["events"] = index = _index_events(data)
+    return data, index
+
+
 @mcp.tool(meta={"ui": {"resourceUri": "ui://bank-holidays"}})
-def get_bank_holidays(country: Optional[str] = None) -> dict:
+async def get_bank_holidays(country: Optional[str] = None) -> dict:
     """Get UK bank holidays.
 
     Args:
         country: Country to get holidays for (england-and-wales, scotland, northern-ireland)
     """
     try:
-        response = requests.get(BANK_HOLIDAYS_URL, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data, index = await _fetch_bank_holidays()
 
         today = date.today()
 
@@ -34,30 +95,18 @@ def get_bank_holidays(country: Optional[str] = None) -> dict:
             if country_key not in data:
                 return {"error": f"Invalid country. Choose from: {', '.join(data.keys())}"}
 
-            events = data[country_key].get("events", [])
-
-            upcoming = [
-                event for event in events
-                if datetime.strptime(event["date"], "%Y-%m-%d").date() >= today
-            ]
-
             return {
                 "country": country_key,
-                "upcoming_holidays": upcoming,
+                "upcoming_holidays": _upcoming(index, country_key, today),
                 "data_source": "GOV.UK Bank Holidays API",
                 "retrieved_at": datetime.now().isoformat()
             }
 
         result = {}
         for country_key, country_data in data.items():
-            events = country_data.get("events", [])
-            upcoming = [
-                event for event in events
-                if datetime.strptime(event["date"], "%Y-%m-%d").date() >= today
-            ]
             result[country_key] = {
                 "division": country_data.get("division"),
-                "upcoming_holidays": upcoming
+                "upcoming_holidays": _upcoming(index, country_key, today)
             }
 
         result["data_source"] = "GOV.UK Bank Holidays API"
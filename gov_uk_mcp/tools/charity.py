@@ -1,12 +1,63 @@
 """Charity Commission lookup tool."""
+import copy
 import re
+import time
 import requests
+from collections import OrderedDict
 from datetime import datetime
+from typing import Any, Optional
+from gov_uk_mcp import http_client
 from gov_uk_mcp.validation import sanitize_api_error, ValidationError
 
 
 CHARITY_API_URL = "https://register-of-charities.charitycommission.gov.uk/api"
 
+# Allow: digits only, SC+digits, NIC+digits, or digits with hyphen suffix
+_CHARITY_NUMBER_RE = re.compile(r'^(SC\d{6}|NIC\d+|\d{6,8}(-\d+)?)$')
+
+# Register entries change on registration events, not minute to minute, so
+# successful lookups are reused for an hour. A result served from the cache
+# keeps the retrieved_at of the original fetch and is marked "cached": True.
+_CACHE_TTL = 3600
+
+
+class _TTLCache:
+    """Size-bounded LRU cache whose entries expire after ttl seconds.
+
+    Values are deep-copied on the way in and out, so a caller mutating a
+    result it was given cannot change what later hits return. Only touched
+    from the tools running on FastMCP's event loop, so it needs no lock.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, copy.deepcopy(value))
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_CHARITY_CACHE = _TTLCache(maxsize=512, ttl=_CACHE_TTL)
+_SEARCH_CACHE = _TTLCache(maxsize=256, ttl=_CACHE_TTL)
+
 
 def _validate_charity_number(charity_number: str) -> str:
     """Validate UK charity registration number format.
@@ -23,8 +74,7 @@ def _validate_charity_number(charity_number: str) -> str:
     if len(cleaned) > 15:
         raise ValidationError("Charity number is too long")
 
-    # Allow: digits only, SC+digits, NIC+digits, or digits with hyphen suffix
-    if not re.match(r'^(SC\d{6}|NIC\d+|\d{6,8}(-\d+)?)$', cleaned):
+    if not _CHARITY_NUMBER_RE.match(cleaned):
         raise ValidationError(
             "Invalid charity number format. Expected 6-8 digits, "
             "SC followed by 6 digits, or NIC followed by digits"
@@ -57,7 +107,7 @@ mcp = _get_mcp()
 
 
 @mcp.tool
-def search_charities(name: str) -> dict:
+async def search_charities(name: str) -> dict:
     """Search for registered charities by name.
 
     Args:
@@ -68,14 +118,20 @@ def search_charities(name: str) -> dict:
     except ValidationError as e:
         return {"error": str(e)}
 
+    cache_key = name.lower()
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+
     try:
-        response = requests.get(
+        response = await http_client.get(
             f"{CHARITY_API_URL}/search-charities",
             params={"q": name, "take": 20},
             timeout=10
         )
         response.raise_for_status()
-        data = response.json()
+        data = http_client.parse_json(response)
 
         charities_data = data.get("charities", [])
 
@@ -93,20 +149,22 @@ def search_charities(name: str) -> dict:
                 "activities": charity.get("activities")
             })
 
-        return {
+        result = {
             "total_results": data.get("count", len(charities)),
             "showing": len(charities),
             "charities": charities,
             "data_source": "Charity Commission Register",
             "retrieved_at": datetime.now().isoformat()
         }
+        _SEARCH_CACHE.set(cache_key, result)
+        return result
 
     except (requests.Timeout, requests.RequestException, requests.HTTPError) as e:
         return sanitize_api_error(e)
 
 
 @mcp.tool(meta={"ui": {"resourceUri": "ui://charity-info"}})
-def get_charity(charity_number: str) -> dict:
+async def get_charity(charity_number: str) -> dict:
     """Get detailed charity information by registration number.
 
     Args:
@@ -117,8 +175,13 @@ def get_charity(charity_number: str) -> dict:
     except ValidationError as e:
         return {"error": str(e)}
 
+    cached = _CHARITY_CACHE.get(charity_number)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+
     try:
-        response = requests.get(
+        response = await http_client.get(
             f"{CHARITY_API_URL}/charity/{charity_number}",
             timeout=10
         )
@@ -127,9 +190,9 @@ def get_charity(charity_number: str) -> dict:
             return {"error": "Charity not found"}
 
         response.raise_for_status()
-        data = response.json()
+        data = http_client.parse_json(response)
 
-        return {
+        result = {
             "charity_number": data.get("charityNumber"),
             "charity_name": data.get("charityName"),
             "registration_status": data.get("registrationStatus"),
@@ -144,6 +207,8 @@ def get_charity(charity_number: str) -> dict:
             "data_source": "Charity Commission Register",
             "retrieved_at": datetime.now().isoformat()
         }
+        _CHARITY_CACHE.set(charity_number, result)
+        return result
 
     except (requests.Timeout, requests.RequestException, requests.HTTPError) as e:
         return sanitize_api_error(e)
@@ -0,0 +1,2165 @@
+"""Inline MCP Apps widget sources (CSS and per-widget HTML/JS).
+
+Kept out of server.py so the large string literals are only compiled when a
+widget is first rendered, not on every server import.
+"""
+import re
+from typing import Optional
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Only whitespace around ``{ } ; ,`` is removed, so selectors, quoted font
+    names and expressions such as ``calc(a + b)`` are left intact.
+    """
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION_SPACE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _minify_js(source: str) -> str:
+    """Drop indentation, blank lines and whole-line ``//`` comments from a widget.
+
+    Line breaks are kept so automatic semicolon insertion is unaffected. The
+    widget scripts contain no multi-line string or template literals, so no
+    line is ever inside a string.
+    """
+    lines = (line.strip() for line in source.split("\n"))
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+# Inline MCP Apps widgets (SEP-1865 compliant)
+# These are self-contained HTML that work with the MCP Apps postMessage protocol
+
+# Styles are minified once when this module is first imported
+WIDGET_STYLES = _minify_css('''
+/* CSS Custom Properties for theming */
+:root {
+  --bg-primary: #1a1a1a;
+  --bg-card: #2a2a2a;
+  --bg-elevated: #333;
+  --text-primary: #fff;
+  --text-secondary: #ccc;
+  --text-muted: #888;
+  --text-dim: #777;
+  --border-subtle: #333;
+  --accent-good: #22c55e;
+  --accent-good-text: #4ade80;
+  --accent-warning: #f59e0b;
+  --accent-warning-text: #fbbf24;
+  --accent-error: #ef4444;
+  --accent-error-text: #f87171;
+  --accent-info: #6366f1;
+  --accent-nhs: #005EB8;
+  --accent-tfl: #0019A8;
+  --accent-govuk: #1D70B8;
+  --accent-parliament: #4A7729;
+  --radius-sm: 4px;
+  --radius-md: 8px;
+  --radius-lg: 12px;
+}
+
+* { box-sizing: border-box; }
+body {
+  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', sans-serif;
+  margin: 0;
+  padding: 16px;
+  background: var(--bg-primary);
+  color: var(--text-secondary);
+  line-height: 1.5;
+  -webkit-font-smoothing: antialiased;
+}
+.widget-container { max-width: 600px; }
+.widget-header { margin-bottom: 16px; }
+.widget-title {
+  font-size: clamp(18px, 4vw, 20px);
+  font-weight: 600;
+  margin: 0 0 4px 0;
+  color: var(--text-primary);
+  letter-spacing: -0.02em;
+}
+.widget-subtitle {
+  font-size: 13px;
+  color: var(--text-muted);
+  margin: 0;
+}
+.widget-section { margin-bottom: 16px; }
+.section-title {
+  font-size: 11px;
+  font-weight: 600;
+  color: var(--text-muted);
+  text-transform: uppercase;
+  letter-spacing: 0.05em;
+  margin-bottom: 8px;
+}
+
+/* Status Cards */
+.status-card {
+  background: var(--bg-card);
+  border-radius: var(--radius-md);
+  padding: 14px 16px;
+  margin-bottom: 8px;
+  border-left: 4px solid #444;
+  box-shadow: 0 1px 3px rgba(0,0,0,0.3);
+  transition: transform 0.15s ease, box-shadow 0.15s ease;
+  position: relative;
+}
+.status-card:hover {
+  transform: translateX(2px);
+  box-shadow: 0 2px 6px rgba(0,0,0,0.4);
+}
+.status-card:focus-visible {
+  outline: 2px solid var(--accent-info);
+  outline-offset: 2px;
+}
+.status-good { border-left-color: var(--accent-good); }
+.status-warning { border-left-color: var(--accent-warning); }
+.status-error { border-left-color: var(--accent-error); }
+/* Brand accent colors for non-status cards */
+.accent-nhs { border-left-color: var(--accent-nhs) !important; }
+.accent-tfl { border-left-color: var(--accent-tfl) !important; }
+.accent-govuk { border-left-color: var(--accent-govuk) !important; }
+.accent-parliament { border-left-color: var(--accent-parliament) !important; }
+.status-header {
+  display: flex;
+  justify-content: space-between;
+  align-items: center;
+  gap: 12px;
+}
+.status-name {
+  font-weight: 500;
+  font-size: 14px;
+  color: var(--text-primary);
+}
+.status-badge {
+  font-size: 11px;
+  padding: 3px 10px;
+  border-radius: var(--radius-lg);
+  font-weight: 500;
+  white-space: nowrap;
+}
+.badge-good { background: rgba(34, 197, 94, 0.15); color: var(--accent-good-text); }
+.badge-warning { background: rgba(245, 158, 11, 0.15); color: var(--accent-warning-text); }
+.badge-error { background: rgba(239, 68, 68, 0.15); color: var(--accent-error-text); }
+.status-reason {
+  font-size: 12px;
+  color: var(--text-muted);
+  margin-top: 8px;
+  line-height: 1.4;
+}
+
+/* Info Grid */
+.info-grid {
+  display: grid;
+  grid-template-columns: repeat(2, 1fr);
+  gap: 10px;
+}
+.info-grid-3 { grid-template-columns: repeat(3, 1fr); }
+.info-item {
+  background: var(--bg-card);
+  padding: 14px;
+  border-radius: var(--radius-md);
+  box-shadow: 0 1px 3px rgba(0,0,0,0.2);
+}
+.info-item:focus-visible {
+  outline: 2px solid var(--accent-info);
+  outline-offset: 2px;
+}
+.info-item-full { grid-column: 1 / -1; }
+.info-item-highlight {
+  background: linear-gradient(135deg, var(--bg-card) 0%, var(--bg-elevated) 100%);
+}
+.info-label {
+  font-size: 10px;
+  color: var(--text-muted);
+  text-transform: uppercase;
+  letter-spacing: 0.05em;
+  font-weight: 500;
+}
+.info-value {
+  font-size: 14px;
+  color: var(--text-primary);
+  margin-top: 4px;
+  font-weight: 500;
+}
+.info-value-sm { font-size: 13px; font-weight: 400; }
+.info-value-lg { font-size: 18px; }
+
+/* Pills / Tags */
+.pill-container {
+  display: flex;
+  flex-wrap: wrap;
+  gap: 6px;
+}
+.pill {
+  padding: 6px 12px;
+  border-radius: 6px;
+  font-size: 12px;
+  font-weight: 500;
+  display: inline-flex;
+  align-items: center;
+  gap: 6px;
+}
+.pill[tabindex]:focus-visible {
+  outline: 2px solid var(--text-primary);
+  outline-offset: 1px;
+}
+.pill-dot {
+  width: 8px;
+  height: 8px;
+  border-radius: 50%;
+  flex-shrink: 0;
+}
+
+/* Profile Card */
+.profile-card {
+  display: flex;
+  gap: 16px;
+  align-items: flex-start;
+}
+.profile-avatar {
+  width: 72px;
+  height: 72px;
+  border-radius: var(--radius-md);
+  background: var(--bg-elevated);
+  object-fit: cover;
+  flex-shrink: 0;
+}
+.profile-info { flex: 1; min-width: 0; }
+.profile-name {
+  font-size: clamp(16px, 4vw, 18px);
+  font-weight: 600;
+  color: var(--text-primary);
+  margin: 0 0 4px 0;
+}
+.profile-party {
+  display: inline-block;
+  padding: 3px 10px;
+  border-radius: var(--radius-lg);
+  font-size: 12px;
+  font-weight: 500;
+  margin-bottom: 8px;
+}
+.profile-meta {
+  font-size: 13px;
+  color: var(--text-muted);
+}
+
+/* Rating Display */
+.rating-badge {
+  display: inline-flex;
+  align-items: center;
+  justify-content: center;
+  width: 40px;
+  height: 40px;
+  border-radius: var(--radius-md);
+  font-size: 18px;
+  font-weight: 700;
+  flex-shrink: 0;
+}
+.rating-5, .rating-4 { background: rgba(34, 197, 94, 0.2); color: var(--accent-good-text); }
+.rating-3 { background: rgba(245, 158, 11, 0.2); color: var(--accent-warning-text); }
+.rating-2, .rating-1, .rating-0 { background: rgba(239, 68, 68, 0.2); color: var(--accent-error-text); }
+.rating-exempt { background: rgba(100, 100, 100, 0.2); color: #999; font-size: 10px; }
+
+/* Score Bar */
+.score-row {
+  display: flex;
+  align-items: center;
+  gap: 8px;
+  margin-top: 8px;
+}
+.score-label {
+  font-size: 10px;
+  color: var(--text-muted);
+  width: 70px;
+  flex-shrink: 0;
+}
+.score-bar {
+  flex: 1;
+  height: 6px;
+  background: var(--bg-elevated);
+  border-radius: 3px;
+  overflow: hidden;
+}
+.score-fill {
+  height: 100%;
+  border-radius: 3px;
+  transition: width 0.3s ease;
+}
+.score-fill-good { background: linear-gradient(90deg, var(--accent-good), var(--accent-good-text)); }
+.score-fill-warning { background: linear-gradient(90deg, var(--accent-warning), var(--accent-warning-text)); }
+.score-fill-error { background: linear-gradient(90deg, var(--accent-error), var(--accent-error-text)); }
+
+/* Address Card */
+.address-card {
+  background: var(--bg-card);
+  border-radius: var(--radius-md);
+  padding: 14px 16px;
+  margin-top: 12px;
+}
+.address-label {
+  font-size: 10px;
+  color: var(--text-muted);
+  text-transform: uppercase;
+  letter-spacing: 0.05em;
+  margin-bottom: 6px;
+}
+.address-text {
+  font-size: 13px;
+  color: var(--text-secondary);
+  line-height: 1.5;
+}
+
+/* Company Status */
+.company-status {
+  display: inline-block;
+  padding: 4px 12px;
+  border-radius: var(--radius-lg);
+  font-size: 11px;
+  font-weight: 600;
+  text-transform: uppercase;
+  letter-spacing: 0.03em;
+}
+.status-active { background: rgba(34, 197, 94, 0.15); color: var(--accent-good-text); }
+.status-dissolved { background: rgba(239, 68, 68, 0.15); color: var(--accent-error-text); }
+.status-liquidation { background: rgba(245, 158, 11, 0.15); color: var(--accent-warning-text); }
+
+/* SIC Codes */
+.sic-list {
+  display: flex;
+  flex-wrap: wrap;
+  gap: 6px;
+  margin-top: 6px;
+}
+.sic-tag {
+  background: var(--bg-elevated);
+  padding: 4px 10px;
+  border-radius: var(--radius-sm);
+  font-size: 12px;
+  color: #aaa;
+  font-family: 'SF Mono', Monaco, Consolas, monospace;
+}
+
+/* Flood Severity */
+.severity-indicator {
+  display: flex;
+  align-items: center;
+  gap: 8px;
+}
+.severity-icon {
+  width: 24px;
+  height: 24px;
+  border-radius: 6px;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  font-size: 14px;
+  flex-shrink: 0;
+}
+.severity-1 { background: rgba(239, 68, 68, 0.2); color: var(--accent-error); }
+.severity-2 { background: rgba(245, 158, 11, 0.2); color: var(--accent-warning); }
+.severity-3 { background: rgba(234, 179, 8, 0.2); color: #eab308; }
+.severity-4 { background: rgba(34, 197, 94, 0.2); color: var(--accent-good); }
+.severity-count-1 { color: var(--accent-error); }
+.severity-count-2 { color: var(--accent-warning); }
+.severity-count-3 { color: #eab308; }
+
+/* MP list */
+.mp-list-item {
+  display: flex;
+  align-items: center;
+  gap: 12px;
+  background: var(--bg-card);
+  padding: 12px 14px;
+  border-radius: var(--radius-md);
+  margin-bottom: 8px;
+}
+.mp-thumb {
+  width: 48px;
+  height: 48px;
+  border-radius: 6px;
+  background: var(--bg-elevated);
+  object-fit: cover;
+  flex-shrink: 0;
+}
+.mp-details { flex: 1; min-width: 0; }
+.mp-name {
+  font-size: 14px;
+  font-weight: 500;
+  color: var(--text-primary);
+  margin-bottom: 2px;
+}
+.mp-constituency {
+  font-size: 12px;
+  color: var(--text-muted);
+}
+.mp-party-badge {
+  padding: 4px 10px;
+  border-radius: var(--radius-lg);
+  font-size: 11px;
+  font-weight: 500;
+  flex-shrink: 0;
+}
+
+/* Footer */
+.widget-footer {
+  font-size: 11px;
+  color: var(--text-dim);
+  margin-top: 16px;
+  padding-top: 12px;
+  border-top: 1px solid var(--bg-card);
+  display: flex;
+  justify-content: space-between;
+  align-items: center;
+}
+
+/* Empty State */
+.empty-state {
+  text-align: center;
+  padding: 32px 16px;
+  color: var(--text-muted);
+}
+.empty-icon {
+  font-size: 32px;
+  margin-bottom: 12px;
+  opacity: 0.5;
+}
+.empty-text {
+  font-size: 14px;
+}
+
+/* Loading */
+.loading {
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  padding: 48px;
+  color: var(--text-muted);
+}
+@keyframes pulse {
+  0%, 100% { opacity: 0.4; transform: scale(0.8); }
+  50% { opacity: 1; transform: scale(1); }
+}
+.loading-dot {
+  width: 8px;
+  height: 8px;
+  background: var(--text-muted);
+  border-radius: 50%;
+  margin: 0 4px;
+  animation: pulse 1.2s ease-in-out infinite;
+}
+.loading-dot:nth-child(1) { animation-delay: 0s; }
+.loading-dot:nth-child(2) { animation-delay: 0.15s; }
+.loading-dot:nth-child(3) { animation-delay: 0.3s; }
+
+/* Skeleton Loading */
+@keyframes shimmer {
+  0% { background-position: -200px 0; }
+  100% { background-position: calc(200px + 100%) 0; }
+}
+.skeleton {
+  background: linear-gradient(90deg, var(--bg-card) 0px, var(--bg-elevated) 40px, var(--bg-card) 80px);
+  background-size: 200px 100%;
+  animation: shimmer 1.5s ease-in-out infinite;
+  border-radius: var(--radius-sm);
+}
+.skeleton-text { height: 14px; margin-bottom: 8px; }
+.skeleton-title { height: 20px; width: 60%; margin-bottom: 12px; }
+.skeleton-card { height: 60px; margin-bottom: 8px; border-radius: var(--radius-md); }
+
+/* Error */
+.error-state {
+  background: rgba(239, 68, 68, 0.08);
+  border: 1px solid rgba(239, 68, 68, 0.2);
+  border-radius: var(--radius-md);
+  padding: 20px;
+  color: var(--accent-error-text);
+  font-size: 13px;
+  text-align: center;
+}
+.error-state::before {
+  content: "!";
+  display: block;
+  width: 32px;
+  height: 32px;
+  margin: 0 auto 12px;
+  background: rgba(239, 68, 68, 0.15);
+  border-radius: 50%;
+  line-height: 32px;
+  font-weight: 600;
+  font-size: 18px;
+}
+.error-raw {
+  margin-top: 10px;
+  padding: 10px;
+  background: var(--bg-primary);
+  font-size: 10px;
+  color: var(--text-muted);
+  max-height: 200px;
+  overflow: auto;
+  word-break: break-all;
+}
+
+/* List Items */
+.title-row {
+  display: flex;
+  justify-content: space-between;
+  align-items: flex-start;
+  gap: 12px;
+}
+.title-main {
+  flex: 1;
+}
+.status-card-plain {
+  border-left: none;
+}
+.status-card-compact {
+  padding: 10px 14px;
+}
+.status-name-sm {
+  font-size: 13px;
+}
+.line-row {
+  display: flex;
+  align-items: center;
+  gap: 10px;
+}
+.line-swatch {
+  width: 4px;
+  height: 28px;
+  border-radius: 2px;
+  flex-shrink: 0;
+}
+.item-main {
+  flex: 1;
+  min-width: 0;
+}
+.item-aside {
+  text-align: right;
+  flex-shrink: 0;
+}
+.item-meta {
+  font-size: 11px;
+  color: #666;
+}
+.item-caption {
+  font-size: 10px;
+  color: #666;
+}
+.item-type {
+  font-size: 11px;
+  color: #666;
+  margin-top: 4px;
+}
+.item-address {
+  font-size: 11px;
+  color: var(--text-muted);
+  margin-top: 4px;
+}
+.item-inspected {
+  font-size: 10px;
+  color: #555;
+  margin-top: 8px;
+}
+.list-overflow {
+  text-align: center;
+  padding: 12px;
+  color: #666;
+  font-size: 12px;
+}
+.score-rows {
+  margin-top: 10px;
+}
+.warning-message {
+  font-size: 12px;
+  color: var(--text-dim);
+  margin-top: 8px;
+  padding-top: 8px;
+  border-top: 1px solid var(--border-subtle);
+}
+.holiday-date {
+  font-size: 12px;
+  color: var(--text-muted);
+}
+.bar-row {
+  margin-bottom: 12px;
+}
+.bar-row-header {
+  display: flex;
+  justify-content: space-between;
+  margin-bottom: 4px;
+}
+.bar-label {
+  font-size: 12px;
+  color: var(--text-secondary);
+}
+.bar-value {
+  font-size: 12px;
+  font-weight: 500;
+  color: var(--text-primary);
+}
+.food-card {
+  display: flex;
+  gap: 14px;
+  align-items: flex-start;
+}
+.food-name {
+  margin-bottom: 4px;
+}
+.food-address {
+  margin-top: 0;
+}
+.rating-row {
+  display: flex;
+  align-items: center;
+  justify-content: space-between;
+  padding: 8px 0;
+  border-bottom: 1px solid var(--border-subtle);
+}
+.rating-row-label {
+  font-size: 13px;
+  color: var(--text-secondary);
+}
+.rating-pill {
+  font-size: 12px;
+  font-weight: 500;
+  padding: 4px 10px;
+  border-radius: var(--radius-lg);
+}
+.vote-header {
+  display: flex;
+  justify-content: space-between;
+  align-items: flex-start;
+  gap: 10px;
+  margin-bottom: 8px;
+}
+.vote-title {
+  font-size: 13px;
+  color: var(--text-primary);
+  font-weight: 500;
+  margin-bottom: 4px;
+}
+.vote-badge {
+  font-size: 11px;
+  font-weight: 600;
+  padding: 4px 10px;
+  border-radius: var(--radius-lg);
+  flex-shrink: 0;
+}
+.vote-split {
+  display: flex;
+  align-items: center;
+  gap: 8px;
+  font-size: 10px;
+}
+.vote-ayes { color: var(--accent-good-text); }
+.vote-noes { color: var(--accent-error-text); }
+.vote-bar {
+  flex: 1;
+  height: 6px;
+  background: var(--bg-elevated);
+  border-radius: 3px;
+  overflow: hidden;
+  display: flex;
+}
+.vote-bar-ayes { background: #4ade80; }
+.vote-bar-noes { background: #f87171; }
+.bike-count {
+  font-size: 18px;
+  font-weight: 600;
+}
+.bike-availability {
+  margin-top: 8px;
+}
+.bike-fill {
+  background: linear-gradient(90deg, #ef4444, #fbbf24, #4ade80);
+}
+.bike-availability-labels {
+  display: flex;
+  justify-content: space-between;
+  font-size: 10px;
+  color: #666;
+  margin-bottom: 4px;
+}
+.journey-header {
+  margin-bottom: 10px;
+}
+.journey-duration {
+  font-size: 15px;
+  font-weight: 600;
+  color: var(--text-primary);
+}
+.journey-times {
+  text-align: right;
+  font-size: 12px;
+  color: var(--text-muted);
+}
+.journey-legs {
+  border-left: 2px solid var(--border-subtle);
+  margin-left: 8px;
+  padding-left: 16px;
+}
+.journey-leg {
+  position: relative;
+  padding: 8px 0;
+}
+.journey-leg:not(:last-child) {
+  border-bottom: 1px dashed var(--border-subtle);
+}
+.journey-leg-marker {
+  position: absolute;
+  left: -24px;
+  top: 8px;
+  width: 16px;
+  height: 16px;
+  background: var(--bg-primary);
+  border-radius: 50%;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  font-size: 8px;
+}
+.journey-leg-body {
+  display: flex;
+  justify-content: space-between;
+  align-items: center;
+}
+.journey-leg-from {
+  font-size: 12px;
+  color: var(--text-primary);
+}
+.journey-leg-instruction {
+  font-size: 11px;
+  color: var(--text-muted);
+  margin-top: 2px;
+}
+.journey-leg-duration {
+  font-size: 11px;
+  color: var(--text-muted);
+}
+.service-distance {
+  font-size: 14px;
+  font-weight: 600;
+  color: var(--accent-nhs);
+}
+.service-phone {
+  margin-top: 8px;
+  font-size: 12px;
+}
+.service-phone-label { color: #666; }
+.service-phone-number { color: var(--accent-good-text); }
+
+/* Utility Classes */
+.font-mono {
+  font-family: 'SF Mono', Monaco, Consolas, monospace;
+  letter-spacing: 0.02em;
+}
+.truncate {
+  overflow: hidden;
+  text-overflow: ellipsis;
+  white-space: nowrap;
+}
+.line-clamp-2 {
+  display: -webkit-box;
+  -webkit-line-clamp: 2;
+  -webkit-box-orient: vertical;
+  overflow: hidden;
+}
+.mt-8 { margin-top: 8px !important; }
+.mt-12 { margin-top: 12px !important; }
+.mt-16 { margin-top: 16px !important; }
+.mt-20 { margin-top: 20px !important; }
+.mb-8 { margin-bottom: 8px !important; }
+.mb-12 { margin-bottom: 12px !important; }
+.mb-16 { margin-bottom: 16px !important; }
+.mb-20 { margin-bottom: 20px !important; }
+.pt-12 { padding-top: 12px !important; }
+.gap-8 { gap: 8px !important; }
+.gap-12 { gap: 12px !important; }
+
+/* Responsive Breakpoints */
+@media (max-width: 400px) {
+  .info-grid { grid-template-columns: 1fr; }
+  .info-grid-3 { grid-template-columns: 1fr; }
+  .profile-avatar { width: 56px; height: 56px; }
+  .profile-name { font-size: 16px; }
+  .widget-title { font-size: 18px; }
+  .status-header { flex-direction: column; align-items: flex-start; gap: 8px; }
+  .profile-card { flex-direction: column; align-items: center; text-align: center; }
+}
+''')
+
+# Loading placeholder shown until the first render; every widget script
+# renders into this #app element
+LOADING_SHELL = (
+    '<div id="app"><div class="loading"><span class="loading-dot"></span>'
+    '<span class="loading-dot"></span><span class="loading-dot"></span></div></div>\n'
+)
+
+WIDGETS = {
+    "tube-status": '''<script>
+// Official TfL line colors
+const TUBE_COLORS = {
+  "Bakerloo": "#B36305",
+  "Central": "#E32017",
+  "Circle": "#FFD300",
+  "District": "#00782A",
+  "Hammersmith & City": "#F3A9BB",
+  "Jubilee": "#A0A5A9",
+  "Metropolitan": "#9B0056",
+  "Northern": "#000000",
+  "Piccadilly": "#003688",
+  "Victoria": "#0098D4",
+  "Waterloo & City": "#95CDBA",
+  "Elizabeth": "#6950a1",
+  "DLR": "#00A4A7",
+  "Overground": "#EE7C0E",
+  "London Overground": "#EE7C0E",
+  "TfL Rail": "#0019A8",
+  "Tram": "#84B817"
+};
+
+// Lines that need dark text on their background
+const DARK_TEXT_LINES = new Set(["Circle", "Hammersmith & City", "Waterloo & City", "Tram"]);
+
+function getStatus(s) {
+  if (!s) return "good";
+  s = s.toLowerCase();
+  if (s.includes("good") || s.includes("special")) return "good";
+  if (s.includes("minor") || s.includes("reduced") || s.includes("part")) return "warning";
+  return "error";
+}
+
+function getStatusIcon(status) {
+  if (status === "good") return "&#10003;";
+  if (status === "warning") return "!";
+  return "&#10005;";
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+  if (!data || !data.lines) {
+    setHtml(app, '<div class="error-state">Unable to load tube status data</div>');
+    return;
+  }
+
+  // Split lines into disrupted and good service in one pass, classifying
+  // each status once
+  const issues = [];
+  const good = [];
+  for (const l of data.lines) {
+    const st = getStatus(l.status);
+    if (st === "good") {
+      good.push(l);
+    } else {
+      issues.push({ l, st });
+    }
+  }
+
+  // Sort issues by severity (errors first)
+  issues.sort((a, b) => {
+    if (a.st === "error" && b.st !== "error") return -1;
+    if (b.st === "error" && a.st !== "error") return 1;
+    return 0;
+  });
+
+  const parts = ['<div class="widget-container">'];
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">TfL Status</h1>');
+
+  if (issues.length > 0) {
+    parts.push('<p class="widget-subtitle">' + issues.length + ' line' + (issues.length > 1 ? 's' : '') + ' with disruptions</p>');
+  } else {
+    parts.push('<p class="widget-subtitle">All lines running normally</p>');
+  }
+  parts.push('</div>');
+
+  // Show disrupted lines first with detailed cards
+  if (issues.length > 0) {
+    parts.push('<div class="widget-section">');
+    parts.push('<div class="section-title">Service Disruptions</div>');
+    // One string and one push per line card
+    issues.forEach(({ l, st }) => {
+      const color = TUBE_COLORS[l.line] || "#666";
+      parts.push(
+        '<div class="status-card status-' + st + '">' +
+        '<div class="status-header">' +
+        '<div class="line-row">' +
+        '<span class="line-swatch" style="background:' + color + '"></span>' +
+        '<span class="status-name">' + escapeHtml(l.line) + '</span>' +
+        '</div>' +
+        '<span class="status-badge badge-' + st + '">' + escapeHtml(l.status) + '</span>' +
+        '</div>' +
+        (l.reason ? '<div class="status-reason">' + escapeHtml(l.reason) + '</div>' : '') +
+        '</div>'
+      );
+    });
+    parts.push('</div>');
+  }
+
+  // Show good service lines as compact pills
+  if (good.length > 0) {
+    parts.push('<div class="widget-section">');
+    parts.push('<div class="section-title">Good Service</div>');
+    parts.push('<div class="pill-container">');
+    good.forEach(l => {
+      const color = TUBE_COLORS[l.line] || "#666";
+      const isDark = DARK_TEXT_LINES.has(l.line);
+      const textColor = isDark ? "#000" : "#fff";
+      const dotBg = isDark ? "rgba(0,0,0,0.3)" : "rgba(255,255,255,0.4)";
+      parts.push(
+        '<span class="pill" style="background:' + color + ';color:' + textColor + '">' +
+        '<span class="pill-dot" style="background:' + dotBg + '"></span>' +
+        escapeHtml(l.line) +
+        '</span>'
+      );
+    });
+    parts.push('</div>');
+    parts.push('</div>');
+  }
+
+  parts.push(renderFooter(data, "Transport for London") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "postcode-lookup": '''<script>
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load postcode data") + '</div>');
+    return;
+  }
+
+  const parts = ['<div class="widget-container">'];
+
+  // Header with prominent postcode
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title" style="font-size:28px;letter-spacing:0.05em;font-family:monospace">' + escapeHtml(data.postcode) + '</h1>');
+  parts.push('<p class="widget-subtitle">' + escapeHtml([data.admin_district, data.region].filter(Boolean).join(", ")) + '</p>');
+  parts.push('</div>');
+
+  // Location info grid
+  parts.push('<div class="widget-section">');
+  parts.push('<div class="section-title">Location</div>');
+  parts.push('<div class="info-grid">');
+
+  if (data.country) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Country</div>');
+    parts.push('<div class="info-value">' + escapeHtml(data.country) + '</div>');
+    parts.push('</div>');
+  }
+
+  if (data.region) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Region</div>');
+    parts.push('<div class="info-value">' + escapeHtml(data.region) + '</div>');
+    parts.push('</div>');
+  }
+
+  if (data.admin_district) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">District</div>');
+    parts.push('<div class="info-value">' + escapeHtml(data.admin_district) + '</div>');
+    parts.push('</div>');
+  }
+
+  if (data.ward) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Ward</div>');
+    parts.push('<div class="info-value">' + escapeHtml(data.ward) + '</div>');
+    parts.push('</div>');
+  }
+
+  parts.push('</div>');
+  parts.push('</div>');
+
+  // Political representation
+  if (data.parliamentary_constituency) {
+    parts.push('<div class="widget-section">');
+    parts.push('<div class="section-title">Parliamentary Constituency</div>');
+    parts.push('<div class="info-item info-item-full info-item-highlight">');
+    parts.push('<div class="info-value" style="font-size:15px">' + escapeHtml(data.parliamentary_constituency) + '</div>');
+    parts.push('</div>');
+    parts.push('</div>');
+  }
+
+  // Coordinates
+  if (data.latitude !== undefined && data.longitude !== undefined) {
+    parts.push('<div class="widget-section">');
+    parts.push('<div class="section-title">Coordinates</div>');
+    parts.push('<div class="info-grid">');
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Latitude</div>');
+    parts.push('<div class="info-value info-value-sm font-mono">' + (typeof data.latitude === 'number' ? data.latitude.toFixed(6) : escapeHtml(data.latitude)) + '</div>');
+    parts.push('</div>');
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Longitude</div>');
+    parts.push('<div class="info-value info-value-sm font-mono">' + (typeof data.longitude === 'number' ? data.longitude.toFixed(6) : escapeHtml(data.longitude)) + '</div>');
+    parts.push('</div>');
+    parts.push('</div>');
+    parts.push('</div>');
+  }
+
+  parts.push('<div class="widget-footer">');
+  parts.push('<span>' + escapeHtml(data.data_source || "Postcodes.io") + '</span>');
+  parts.push('</div>');
+  parts.push('</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "company-info": '''<script>
+function getStatusClass(status) {
+  if (!status) return "";
+  const s = status.toLowerCase();
+  if (s === "active") return "status-active";
+  if (s.includes("dissolv") || s.includes("struck")) return "status-dissolved";
+  if (s.includes("liquid") || s.includes("admin") || s.includes("receiv")) return "status-liquidation";
+  return "";
+}
+
+const COMPANY_TYPES = {
+  "ltd": "Private Limited",
+  "private-limited-guarant-nsc": "Private Limited by Guarantee",
+  "plc": "Public Limited Company",
+  "llp": "Limited Liability Partnership",
+  "private-unlimited": "Private Unlimited"
+};
+
+function formatCompanyType(type) {
+  return COMPANY_TYPES[type] || (type ? escapeHtml(titleizeKebab(type)) : "");
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load company data") + '</div>');
+    return;
+  }
+
+  const parts = ['<div class="widget-container">'];
+
+  // Header with company name and status badge
+  parts.push('<div class="widget-header mb-20">');
+  parts.push('<div class="title-row">');
+  parts.push('<div>');
+  parts.push('<h1 class="widget-title" style="margin-bottom:6px">' + escapeHtml(data.company_name) + '</h1>');
+  parts.push('<p class="widget-subtitle font-mono" style="letter-spacing:0.05em">' + escapeHtml(data.company_number) + '</p>');
+  parts.push('</div>');
+  if (data.company_status) {
+    parts.push('<span class="company-status ' + getStatusClass(data.company_status) + '">' + escapeHtml(data.company_status) + '</span>');
+  }
+  parts.push('</div>');
+  parts.push('</div>');
+
+  // Company details
+  parts.push('<div class="widget-section">');
+  parts.push('<div class="section-title">Company Details</div>');
+  parts.push('<div class="info-grid">');
+
+  if (data.company_type) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Type</div>');
+    parts.push('<div class="info-value info-value-sm">' + formatCompanyType(data.company_type) + '</div>');
+    parts.push('</div>');
+  }
+
+  if (data.date_of_creation) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Incorporated</div>');
+    parts.push('<div class="info-value">' + formatDate(data.date_of_creation) + '</div>');
+    parts.push('</div>');
+  }
+
+  if (data.jurisdiction) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Jurisdiction</div>');
+    parts.push('<div class="info-value">' + escapeHtml(titleizeKebab(data.jurisdiction)) + '</div>');
+    parts.push('</div>');
+  }
+
+  // Accounts info
+  if (data.accounts?.last_accounts?.made_up_to) {
+    parts.push('<div class="info-item">');
+    parts.push('<div class="info-label">Last Accounts</div>');
+    parts.push('<div class="info-value info-value-sm">' + formatDate(data.accounts.last_accounts.made_up_to) + '</div>');
+    parts.push('</div>');
+  }
+
+  parts.push('</div>');
+  parts.push('</div>');
+
+  // SIC codes
+  if (data.sic_codes && data.sic_codes.length > 0) {
+    parts.push('<div class="widget-section">');
+    parts.push('<div class="section-title">SIC Codes</div>');
+    parts.push('<div class="sic-list">');
+    data.sic_codes.forEach(code => {
+      parts.push('<span class="sic-tag">' + escapeHtml(code) + '</span>');
+    });
+    parts.push('</div>');
+    parts.push('</div>');
+  }
+
+  // Registered address
+  if (data.registered_office_address) {
+    const addr = data.registered_office_address;
+    const addressParts = [
+      addr.address_line_1,
+      addr.address_line_2,
+      addr.locality,
+      addr.region,
+      addr.postal_code,
+      addr.country
+    ].filter(Boolean).map(p => escapeHtml(p));
+
+    if (addressParts.length > 0) {
+      parts.push('<div class="address-card">');
+      parts.push('<div class="address-label">Registered Office</div>');
+      parts.push('<div class="address-text">' + addressParts.join("<br>") + '</div>');
+      parts.push('</div>');
+    }
+  }
+
+  // Warning indicators
+  if (data.has_insolvency_history || data.has_charges) {
+    parts.push('<div style="display:flex;gap:8px;margin-top:12px">');
+    if (data.has_insolvency_history) {
+      parts.push('<span class="status-badge badge-warning">Insolvency History</span>');
+    }
+    if (data.has_charges) {
+      parts.push('<span class="status-badge badge-warning">Has Charges</span>');
+    }
+    parts.push('</div>');
+  }
+
+  parts.push('<div class="widget-footer">');
+  parts.push('<span>Companies House</span>');
+  if (data.retrieved_at) {
+    parts.push('<span>Updated ' + formatTime(data.retrieved_at) + '</span>');
+  }
+  parts.push('</div>');
+  parts.push('</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "food-hygiene": '''<script>
+function getRatingClass(rating) {
+  if (rating === "Exempt" || rating === "AwaitingInspection") return "rating-exempt";
+  const num = parseInt(rating, 10);
+  if (isNaN(num)) return "rating-exempt";
+  if (num >= 4) return "rating-5";
+  if (num === 3) return "rating-3";
+  return "rating-0";
+}
+
+function getRatingDisplay(rating) {
+  if (rating === "Exempt") return "EX";
+  if (rating === "AwaitingInspection") return "...";
+  return rating;
+}
+
+function getScoreClass(score) {
+  if (score === null || score === undefined) return "";
+  if (score <= 5) return "score-fill-good";
+  if (score <= 10) return "score-fill-warning";
+  return "score-fill-error";
+}
+
+function getScorePercent(score) {
+  // FSA scores: 0 is best, 20+ is worst. Invert for visual
+  if (score === null || score === undefined) return 0;
+  return Math.max(0, Math.min(100, (20 - score) * 5));
+}
+
+// Score bar row, or an empty string when the score is missing
+function scoreRow(label, score) {
+  if (score === null || score === undefined) return "";
+  return `<div class="score-row"><span class="score-label">${label}</span>` +
+    `<div class="score-bar"><div class="score-fill ${getScoreClass(score)}" style="width:${getScorePercent(score)}%"></div></div></div>`;
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (data?.message && !data.establishments) {
+    setHtml(app, '<div class="empty-state"><div class="empty-text">' + escapeHtml(data.message) + '</div></div>');
+    return;
+  }
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load food hygiene data") + '</div>');
+    return;
+  }
+
+  const establishments = data.establishments || [];
+
+  const parts = ['<div class="widget-container">'];
+
+  // Header
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">Food Hygiene Ratings</h1>');
+  parts.push('<p class="widget-subtitle">' + data.total_results + ' establishment' + (data.total_results !== 1 ? 's' : '') + ' found</p>');
+  parts.push('</div>');
+
+  // Establishments list
+  if (establishments.length > 0) {
+    // One push per establishment card
+    establishments.slice(0, 10).forEach(e => {
+      const rating = e.rating || "N/A";
+      const ratingClass = getRatingClass(rating);
+
+      // Address
+      const addressParts = [e.address, e.postcode].filter(Boolean).map(p => escapeHtml(p));
+
+      // Score bars (only if scores available)
+      const hasScores = e.hygiene_score !== null || e.structural_score !== null || e.confidence_in_management !== null;
+      let scores = "";
+      if (hasScores) {
+        scores = '<div class="score-rows">' +
+          scoreRow("Hygiene", e.hygiene_score) +
+          scoreRow("Structural", e.structural_score) +
+          scoreRow("Management", e.confidence_in_management) +
+          '</div>';
+      }
+
+      parts.push(
+        '<div class="status-card status-card-plain food-card">' +
+        // Rating badge
+        `<div class="rating-badge ${ratingClass}">${getRatingDisplay(rating)}</div>` +
+        // Business details
+        `<div class="item-main"><div class="status-name food-name">${escapeHtml(e.business_name)}</div>` +
+        (addressParts.length > 0 ? `<div class="status-reason food-address">${addressParts.join(", ")}</div>` : "") +
+        (e.business_type ? `<div class="item-type">${escapeHtml(e.business_type)}</div>` : "") +
+        scores +
+        (e.rating_date ? `<div class="item-inspected">Inspected: ${formatDate(e.rating_date)}</div>` : "") +
+        '</div></div>'
+      );
+    });
+
+    // Show "more" indicator
+    if (data.total_results > 10) {
+      parts.push('<div class="list-overflow">Showing 10 of ' + data.total_results + ' results</div>');
+    }
+  }
+
+  parts.push(renderFooter(data, "Food Standards Agency") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "flood-warnings": '''<script>
+// Environment Agency severity levels: 1=Severe, 2=Warning, 3=Alert, 4=No longer in force
+const SEVERITIES = {
+  1: { class: "severity-1", icon: "!!", label: "Severe Flood Warning", color: "#ef4444", cardClass: "status-error" },
+  2: { class: "severity-2", icon: "!", label: "Flood Warning", color: "#f59e0b", cardClass: "status-warning" },
+  3: { class: "severity-3", icon: "i", label: "Flood Alert", color: "#eab308", cardClass: "status-warning" },
+  4: { class: "severity-4", icon: "-", label: "Warning Removed", color: "#22c55e", cardClass: "status-good" }
+};
+
+// Most warnings rendered; the most severe are listed first
+const MAX_WARNINGS = 50;
+
+// Markup that depends only on the severity level is built once per level
+for (const sev of Object.values(SEVERITIES)) {
+  sev.cardOpen = `<div class="status-card ${sev.cardClass}"><div class="status-header"><div class="severity-indicator"><div class="severity-icon ${sev.class}">${sev.icon}</div>`;
+  sev.labelHtml = `<div class="item-meta">${escapeHtml(sev.label)}</div>`;
+}
+
+function getSeverityInfo(level) {
+  return SEVERITIES[level] || SEVERITIES[3];
+}
+
+function formatTimeAgo(dateStr) {
+  if (!dateStr) return "";
+  const date = new Date(dateStr);
+  const now = new Date();
+  const diffMs = now - date;
+  const diffMins = Math.floor(diffMs / 60000);
+  const diffHours = Math.floor(diffMins / 60);
+  const diffDays = Math.floor(diffHours / 24);
+
+  if (diffMins < 60) return diffMins + " min" + (diffMins !== 1 ? "s" : "") + " ago";
+  if (diffHours < 24) return diffHours + " hour" + (diffHours !== 1 ? "s" : "") + " ago";
+  return diffDays + " day" + (diffDays !== 1 ? "s" : "") + " ago";
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (data?.message && !data.warnings) {
+    setHtml(app, '<div class="widget-container">' +
+      '<div class="widget-header">' +
+      '<h1 class="widget-title">Flood Warnings</h1>' +
+      '</div>' +
+      '<div class="empty-state" style="background:#2a2a2a;border-radius:8px">' +
+      '<div style="font-size:24px;margin-bottom:8px;opacity:0.5">&#10003;</div>' +
+      '<div class="empty-text">' + escapeHtml(data.message) + '</div>' +
+      '</div>' +
+      '<div class="widget-footer"><span>' + escapeHtml(data.data_source || "Environment Agency") + '</span></div>' +
+      '</div>');
+    return;
+  }
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load flood warning data") + '</div>');
+    return;
+  }
+
+  const warnings = data.warnings || [];
+
+  // Order by severity (most severe first) with one stable bucketing pass;
+  // unknown levels are shown as alerts but not counted as them
+  const buckets = [[], [], [], [], []];
+  let alert = 0;
+  for (const w of warnings) {
+    if (w.severity === 3) alert++;
+    buckets[SEVERITIES[w.severity] ? w.severity : 3].push(w);
+  }
+  const severe = buckets[1].length;
+  const warning = buckets[2].length;
+  const sorted = buckets[1].concat(buckets[2], buckets[3], buckets[4]);
+
+  // Header with summary
+  let subtitle = "No active warnings";
+  if (warnings.length > 0) {
+    subtitle = "";
+    if (severe > 0) subtitle = `<span class="severity-count-1">${severe} severe</span>`;
+    if (warning > 0) subtitle += (subtitle ? " | " : "") + `<span class="severity-count-2">${warning} warning${warning !== 1 ? "s" : ""}</span>`;
+    if (alert > 0) subtitle += (subtitle ? " | " : "") + `<span class="severity-count-3">${alert} alert${alert !== 1 ? "s" : ""}</span>`;
+  }
+  const parts = [
+    `<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Flood Warnings</h1><p class="widget-subtitle">${subtitle}</p></div>`
+  ];
+
+  // Warning cards, one template literal per card, capped at MAX_WARNINGS
+  const visible = sorted.length > MAX_WARNINGS ? sorted.slice(0, MAX_WARNINGS) : sorted;
+  visible.forEach(w => {
+    const sev = getSeverityInfo(w.severity);
+    const msgText = w.message ? truncate(w.message, 200) : "";
+    parts.push(
+      sev.cardOpen +
+      `<div><div class="status-name">${escapeHtml(w.area || "Unknown area")}</div>${sev.labelHtml}</div>` +
+      `</div>${w.time_raised ? `<span class="item-meta">${formatTimeAgo(w.time_raised)}</span>` : ""}</div>` +
+      (w.description ? `<div class="status-reason">${escapeHtml(w.description)}</div>` : "") +
+      (w.message ? `<div class="warning-message">${escapeHtml(msgText)}</div>` : "") +
+      `</div>`
+    );
+  });
+
+  if (sorted.length > MAX_WARNINGS) {
+    parts.push(`<div class="list-overflow">Showing ${MAX_WARNINGS} of ${sorted.length} warnings</div>`);
+  }
+
+  parts.push(renderFooter(data, "Environment Agency") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "mp-info": '''<script>
+// UK Political party colors
+const PARTY_COLORS = {
+  "Conservative": { bg: "rgba(0, 135, 220, 0.15)", color: "#0087DC", text: "#5BC0F5" },
+  "Labour": { bg: "rgba(228, 0, 59, 0.15)", color: "#E4003B", text: "#FF6B8A" },
+  "Liberal Democrat": { bg: "rgba(250, 166, 26, 0.15)", color: "#FAA61A", text: "#FFC04D" },
+  "Liberal Democrats": { bg: "rgba(250, 166, 26, 0.15)", color: "#FAA61A", text: "#FFC04D" },
+  "Scottish National Party": { bg: "rgba(255, 249, 93, 0.15)", color: "#FFF95D", text: "#FFF95D" },
+  "SNP": { bg: "rgba(255, 249, 93, 0.15)", color: "#FFF95D", text: "#FFF95D" },
+  "Green Party": { bg: "rgba(106, 176, 35, 0.15)", color: "#6AB023", text: "#8FD94D" },
+  "Green": { bg: "rgba(106, 176, 35, 0.15)", color: "#6AB023", text: "#8FD94D" },
+  "Plaid Cymru": { bg: "rgba(0, 129, 66, 0.15)", color: "#008142", text: "#4DBA7D" },
+  "Democratic Unionist Party": { bg: "rgba(212, 58, 58, 0.15)", color: "#D43A3A", text: "#F07070" },
+  "DUP": { bg: "rgba(212, 58, 58, 0.15)", color: "#D43A3A", text: "#F07070" },
+  "Sinn Fein": { bg: "rgba(50, 100, 50, 0.15)", color: "#326432", text: "#5DAD5D" },
+  "Sinn Féin": { bg: "rgba(50, 100, 50, 0.15)", color: "#326432", text: "#5DAD5D" },
+  "Alliance": { bg: "rgba(242, 183, 5, 0.15)", color: "#F2B705", text: "#FFD54D" },
+  "SDLP": { bg: "rgba(45, 115, 71, 0.15)", color: "#2D7347", text: "#5DAD7D" },
+  "UUP": { bg: "rgba(72, 166, 227, 0.15)", color: "#48A6E3", text: "#7FC4F0" },
+  "Reform UK": { bg: "rgba(18, 178, 199, 0.15)", color: "#12B2C7", text: "#4DD4E8" },
+  "Independent": { bg: "rgba(128, 128, 128, 0.15)", color: "#808080", text: "#A0A0A0" },
+  "Speaker": { bg: "rgba(128, 128, 128, 0.15)", color: "#808080", text: "#A0A0A0" }
+};
+
+const PARTY_FALLBACK = PARTY_COLORS["Independent"];
+
+function getPartyStyle(party) {
+  return PARTY_COLORS[party] || PARTY_FALLBACK;
+}
+
+// Most MPs rendered in the list view
+const MAX_MPS = 100;
+
+// Party badge markup for the MP list, built once per distinct party
+const partyBadges = new Map();
+function getPartyBadge(party) {
+  let badge = partyBadges.get(party);
+  if (badge === undefined) {
+    const style = getPartyStyle(party);
+    badge = `<span class="mp-party-badge" style="background:${style.bg};color:${style.text}">${escapeHtml(party)}</span>`;
+    partyBadges.set(party, badge);
+  }
+  return badge;
+}
+
+// Placeholder shown instead of a photo, keyed by the image class
+const AVATAR_FALLBACK_STYLE = {
+  "mp-thumb": "display:flex;align-items:center;justify-content:center;font-size:18px;color:#666",
+  "profile-avatar": "display:flex;align-items:center;justify-content:center;font-size:28px;color:#666"
+};
+
+// Photos that fail to load are replaced by the initial in data-initial.
+// Load errors do not bubble, so one capturing listener covers every image.
+document.addEventListener("error", (event) => {
+  const img = event.target;
+  if (!(img instanceof HTMLImageElement) || img.dataset.initial === undefined) return;
+  const fallback = document.createElement("div");
+  fallback.className = img.className;
+  fallback.style.cssText = AVATAR_FALLBACK_STYLE[img.className] || "";
+  fallback.textContent = img.dataset.initial;
+  img.replaceWith(fallback);
+}, true);
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load MP data") + '</div>');
+    return;
+  }
+
+  // Multiple MPs result
+  if (data.mps && data.mps.length > 0) {
+    const parts = [
+      `<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Members of Parliament</h1><p class="widget-subtitle">${data.mps.length} MP${data.mps.length !== 1 ? "s" : ""} found</p></div>`
+    ];
+
+    // One template literal per list item, capped at MAX_MPS
+    const mps = data.mps.length > MAX_MPS ? data.mps.slice(0, MAX_MPS) : data.mps;
+    mps.forEach(mp => {
+      // Thumbnail, swapped for the initial if it fails to load
+      const mpInitial = mp.name ? escapeHtml(mp.name.charAt(0)) : "?";
+      const thumb = mp.thumbnail_url
+        ? `<img class="mp-thumb" src="${escapeHtml(mp.thumbnail_url)}" alt="" data-initial="${mpInitial}">`
+        : `<div class="mp-thumb" style="${AVATAR_FALLBACK_STYLE["mp-thumb"]}">${mpInitial}</div>`;
+
+      parts.push(
+        `<div class="mp-list-item">${thumb}` +
+        `<div class="mp-details"><div class="mp-name">${escapeHtml(mp.name)}</div><div class="mp-constituency">${escapeHtml(mp.constituency)}</div></div>` +
+        `${getPartyBadge(mp.party)}</div>`
+      );
+    });
+
+    if (data.mps.length > MAX_MPS) {
+      parts.push(`<div class="list-overflow">Showing ${MAX_MPS} of ${data.mps.length} MPs</div>`);
+    }
+
+    parts.push(`<div class="widget-footer"><span>${escapeHtml(data.data_source || "UK Parliament")}</span></div></div>`);
+
+    setHtml(app, parts.join(''));
+    return;
+  }
+
+  // Single MP result - profile card view
+  const party = getPartyStyle(data.party);
+
+  // Avatar, swapped for the initial if it fails to load
+  const initial = data.name ? escapeHtml(data.name.charAt(0)) : "?";
+  const avatar = data.thumbnail_url
+    ? `<img class="profile-avatar" src="${escapeHtml(data.thumbnail_url)}" alt="" data-initial="${initial}">`
+    : `<div class="profile-avatar" style="${AVATAR_FALLBACK_STYLE["profile-avatar"]}">${initial}</div>`;
+
+  const parts = [
+    `<div class="widget-container"><div class="profile-card">${avatar}` +
+    `<div class="profile-info"><h1 class="profile-name">${escapeHtml(data.name)}</h1>` +
+    `<span class="profile-party" style="background:${party.bg};color:${party.text}">${escapeHtml(data.party)}</span>` +
+    `<div class="profile-meta">${escapeHtml(data.constituency)}</div></div></div>`
+  ];
+
+  // Additional details
+  parts.push(
+    `<div class="widget-section" style="margin-top:20px"><div class="info-grid">` +
+    `<div class="info-item"><div class="info-label">Constituency</div><div class="info-value">${escapeHtml(data.constituency)}</div></div>`
+  );
+  if (data.membership_start) {
+    parts.push(`<div class="info-item"><div class="info-label">MP Since</div><div class="info-value">${formatDate(data.membership_start)}</div></div>`);
+  }
+  if (data.gender) {
+    parts.push(`<div class="info-item"><div class="info-label">Gender</div><div class="info-value">${escapeHtml(data.gender)}</div></div>`);
+  }
+  parts.push('</div></div>');
+
+  parts.push(renderFooter(data, "UK Parliament") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "bank-holidays": '''<script>
+// Bank holidays uses a custom date format with weekday
+const HOLIDAY_DATE_FORMAT = new Intl.DateTimeFormat("en-GB", { weekday: "short", day: "numeric", month: "short", year: "numeric" });
+const MS_PER_DAY = 86400000;
+
+function formatHolidayDate(dateStr) {
+  if (!dateStr) return "";
+  try {
+    const d = new Date(dateStr);
+    if (isNaN(d.getTime())) return dateStr;
+    return HOLIDAY_DATE_FORMAT.format(d);
+  } catch (e) {
+    return dateStr;
+  }
+}
+
+function daysUntil(dateStr) {
+  if (!dateStr) return null;
+  const target = new Date(dateStr);
+  const today = new Date();
+  today.setHours(0, 0, 0, 0);
+  target.setHours(0, 0, 0, 0);
+  return Math.ceil((target - today) / MS_PER_DAY);
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load bank holidays") + '</div>');
+    return;
+  }
+
+  // Handle single country or all countries
+  let holidays = [];
+  let countryName = "";
+  let subtitle = "";
+
+  if (data.country && data.upcoming_holidays) {
+    holidays = data.upcoming_holidays;
+    countryName = titleizeKebab(data.country);
+    subtitle = `<p class="widget-subtitle">${escapeHtml(countryName)}</p>`;
+  } else {
+    // Show England & Wales by default
+    const ew = data["england-and-wales"];
+    if (ew && ew.upcoming_holidays) {
+      holidays = ew.upcoming_holidays;
+      countryName = "England & Wales";
+      subtitle = `<p class="widget-subtitle">${escapeHtml(countryName)}</p>`;
+    }
+  }
+
+  const parts = [
+    `<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Bank Holidays</h1>${subtitle}</div>`
+  ];
+
+  if (holidays.length > 0) {
+    // Next holiday highlight
+    const next = holidays[0];
+    const days = daysUntil(next.date);
+
+    let countdown = "";
+    if (days !== null) {
+      if (days === 0) {
+        countdown = '<div style="font-size:20px;font-weight:600;color:#4ade80">Today!</div>';
+      } else if (days === 1) {
+        countdown = '<div style="font-size:20px;font-weight:600;color:#fbbf24">Tomorrow</div>';
+      } else {
+        countdown = `<div style="font-size:24px;font-weight:600;color:#6366f1">${days}</div><div style="font-size:11px;color:#666">days away</div>`;
+      }
+      countdown = `<div style="text-align:right">${countdown}</div>`;
+    }
+
+    parts.push(
+      `<div class="status-card status-good" style="border-left-color:#6366f1"><div class="status-header"><div>` +
+      `<div class="status-name" style="font-size:16px">${escapeHtml(next.title)}</div>` +
+      `<div style="font-size:13px;color:#888;margin-top:4px">${formatHolidayDate(next.date)}</div>` +
+      `</div>${countdown}</div></div>`
+    );
+
+    // Upcoming holidays list, one template literal per holiday
+    if (holidays.length > 1) {
+      parts.push('<div class="widget-section"><div class="section-title">Upcoming</div>');
+      holidays.slice(1, 6).forEach(h => {
+        parts.push(
+          `<div class="status-card status-card-compact"><div class="status-header">` +
+          `<span class="status-name status-name-sm">${escapeHtml(h.title)}</span>` +
+          `<span class="holiday-date">${formatHolidayDate(h.date)}</span></div></div>`
+        );
+      });
+      parts.push('</div>');
+    }
+  } else {
+    parts.push('<div class="empty-state"><div class="empty-text">No upcoming bank holidays</div></div>');
+  }
+
+  parts.push(renderFooter(data, "GOV.UK") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "crime-stats": '''<script>
+const CRIME_COLORS = {
+  "anti-social-behaviour": "#f59e0b",
+  "burglary": "#ef4444",
+  "criminal-damage-arson": "#f97316",
+  "drugs": "#8b5cf6",
+  "other-theft": "#ec4899",
+  "possession-of-weapons": "#dc2626",
+  "public-order": "#eab308",
+  "robbery": "#b91c1c",
+  "shoplifting": "#f472b6",
+  "theft-from-the-person": "#e879f9",
+  "vehicle-crime": "#6366f1",
+  "violent-crime": "#ef4444",
+  "other-crime": "#6b7280",
+  "bicycle-theft": "#14b8a6"
+};
+
+// Number of category bars shown
+const TOP_CATEGORIES = 8;
+
+// Known categories get a fixed slot in a counts array
+const CRIME_KEYS = Object.keys(CRIME_COLORS);
+const CRIME_INDEX = new Map(CRIME_KEYS.map((k, i) => [k, i]));
+
+function formatCategory(cat) {
+  if (!cat) return "Unknown";
+  return titleizeKebab(cat);
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (data?.message && !data.crimes) {
+    setHtml(app, '<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Crime Data</h1></div><div class="empty-state"><div class="empty-text">' + escapeHtml(data.message) + '</div></div></div>');
+    return;
+  }
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load crime data") + '</div>');
+    return;
+  }
+
+  const crimes = data.crimes || [];
+
+  // Count by category; anything outside CRIME_COLORS is tallied separately
+  const counts = new Uint32Array(CRIME_KEYS.length);
+  const otherCounts = new Map();
+  for (const c of crimes) {
+    const cat = c.category || "other-crime";
+    const idx = CRIME_INDEX.get(cat);
+    if (idx !== undefined) counts[idx]++;
+    else otherCounts.set(cat, (otherCounts.get(cat) || 0) + 1);
+  }
+
+  // Keep only the TOP_CATEGORIES largest counts, in descending order
+  const sorted = [];
+  const addCount = (cat, count) => {
+    if (!count || (sorted.length === TOP_CATEGORIES && count <= sorted[TOP_CATEGORIES - 1][1])) return;
+    let i = Math.min(sorted.length, TOP_CATEGORIES - 1);
+    while (i > 0 && sorted[i - 1][1] < count) {
+      sorted[i] = sorted[i - 1];
+      i--;
+    }
+    sorted[i] = [cat, count];
+  };
+  counts.forEach((count, i) => addCount(CRIME_KEYS[i], count));
+  otherCounts.forEach((count, cat) => addCount(cat, count));
+  const maxCount = sorted.length > 0 ? sorted[0][1] : 1;
+
+  const parts = [
+    `<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Crime Statistics</h1><p class="widget-subtitle">${data.total_crimes | 0} incidents reported</p></div>`
+  ];
+
+  if (sorted.length > 0) {
+    parts.push('<div class="widget-section"><div class="section-title">By Category</div>');
+
+    // One template literal per category bar
+    sorted.forEach(([cat, count]) => {
+      const color = CRIME_COLORS[cat] || "#6b7280";
+      const pct = Math.round((count / maxCount) * 100);
+
+      parts.push(
+        `<div class="bar-row"><div class="bar-row-header">` +
+        `<span class="bar-label">${escapeHtml(formatCategory(cat))}</span>` +
+        `<span class="bar-value">${count}</span></div>` +
+        `<div class="score-bar"><div class="score-fill" style="width:${pct}%;background:${color}"></div></div></div>`
+      );
+    });
+
+    parts.push('</div>');
+  }
+
+  parts.push(renderFooter(data, "Police.uk") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "cqc-rating": '''<script>
+const RATING_STYLES = {
+  "Outstanding": { bg: "rgba(34, 197, 94, 0.15)", color: "#4ade80", icon: "★★" },
+  "Good": { bg: "rgba(34, 197, 94, 0.15)", color: "#4ade80", icon: "★" },
+  "Requires improvement": { bg: "rgba(245, 158, 11, 0.15)", color: "#fbbf24", icon: "!" },
+  "Inadequate": { bg: "rgba(239, 68, 68, 0.15)", color: "#f87171", icon: "✗" }
+};
+
+const RATING_FALLBACK = { bg: "rgba(100,100,100,0.15)", color: "#888", icon: "?" };
+
+function getRatingStyle(rating) {
+  return RATING_STYLES[rating] || RATING_FALLBACK;
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load CQC data") + '</div>');
+    return;
+  }
+
+  const overall = getRatingStyle(data.overall_rating);
+
+  // Header with overall rating
+  const parts = [
+    `<div class="widget-container"><div class="widget-header mb-20">` +
+    `<div class="title-row">` +
+    `<div class="title-main"><h1 class="widget-title">${escapeHtml(data.name)}</h1><p class="widget-subtitle">${escapeHtml(data.type || "Care Provider")}</p></div>` +
+    `<div style="text-align:center;padding:12px 16px;border-radius:8px;background:${overall.bg}">` +
+    `<div style="font-size:20px">${overall.icon}</div>` +
+    `<div style="font-size:12px;font-weight:600;color:${overall.color}">${escapeHtml(data.overall_rating || "Not Rated")}</div>` +
+    `</div></div></div>`
+  ];
+
+  // Rating breakdown
+  if (data.ratings) {
+    parts.push('<div class="widget-section"><div class="section-title">Rating Breakdown</div>');
+
+    const categories = [
+      { key: "safe", label: "Safe" },
+      { key: "effective", label: "Effective" },
+      { key: "caring", label: "Caring" },
+      { key: "responsive", label: "Responsive" },
+      { key: "well_led", label: "Well-led" }
+    ];
+
+    categories.forEach(cat => {
+      const rating = data.ratings[cat.key];
+      const style = getRatingStyle(rating);
+
+      parts.push(
+        `<div class="rating-row"><span class="rating-row-label">${cat.label}</span>` +
+        `<span class="rating-pill" style="background:${style.bg};color:${style.color}">${escapeHtml(rating || "N/A")}</span></div>`
+      );
+    });
+
+    parts.push('</div>');
+  }
+
+  // Inspection date
+  if (data.inspection_date) {
+    parts.push(`<div class="info-item" style="margin-top:12px"><div class="info-label">Last Inspection</div><div class="info-value info-value-sm">${formatDate(data.inspection_date)}</div></div>`);
+  }
+
+  parts.push(renderFooter(data, "Care Quality Commission") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "charity-info": '''<script>
+const STATUS_STYLES = {
+  unknown: { bg: "rgba(100,100,100,0.15)", color: "#888" },
+  registered: { bg: "rgba(34, 197, 94, 0.15)", color: "#4ade80" },
+  removed: { bg: "rgba(239, 68, 68, 0.15)", color: "#f87171" },
+  other: { bg: "rgba(245, 158, 11, 0.15)", color: "#fbbf24" }
+};
+
+function getStatusStyle(status) {
+  if (!status) return STATUS_STYLES.unknown;
+  const s = status.toLowerCase();
+  if (s.includes("registered") || s.includes("active")) return STATUS_STYLES.registered;
+  if (s.includes("removed")) return STATUS_STYLES.removed;
+  return STATUS_STYLES.other;
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load charity data") + '</div>');
+    return;
+  }
+
+  const statusStyle = getStatusStyle(data.registration_status);
+
+  // Header
+  const parts = [
+    `<div class="widget-container"><div class="widget-header mb-20">` +
+    `<div class="title-row">` +
+    `<div class="title-main"><h1 class="widget-title">${escapeHtml(data.charity_name || "Unknown Charity")}</h1>` +
+    `<p class="widget-subtitle" style="font-family:monospace">No. ${escapeHtml(data.charity_number || "N/A")}</p></div>` +
+    (data.registration_status ? `<span class="company-status" style="background:${statusStyle.bg};color:${statusStyle.color}">${escapeHtml(data.registration_status)}</span>` : "") +
+    `</div></div>`
+  ];
+
+  // Details grid
+  parts.push('<div class="widget-section"><div class="info-grid">');
+  if (data.charity_type) {
+    parts.push(`<div class="info-item"><div class="info-label">Type</div><div class="info-value info-value-sm">${escapeHtml(data.charity_type)}</div></div>`);
+  }
+  if (data.registration_date) {
+    parts.push(`<div class="info-item"><div class="info-label">Registered</div><div class="info-value">${formatDate(data.registration_date)}</div></div>`);
+  }
+  if (data.removal_date) {
+    parts.push(`<div class="info-item"><div class="info-label">Removed</div><div class="info-value">${formatDate(data.removal_date)}</div></div>`);
+  }
+  parts.push('</div></div>');
+
+  // Activities
+  if (data.activities) {
+    const activitiesText = truncate(data.activities, 300);
+    parts.push(
+      `<div class="widget-section"><div class="section-title">Activities</div>` +
+      `<div style="font-size:13px;color:#ccc;line-height:1.5;background:#2a2a2a;padding:12px;border-radius:8px">${escapeHtml(activitiesText)}</div></div>`
+    );
+  }
+
+  parts.push(renderFooter(data, "Charity Commission") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "voting-record": '''<script>
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (data?.message && !data.votes) {
+    setHtml(app, '<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Voting Record</h1></div><div class="empty-state"><div class="empty-text">' + escapeHtml(data.message) + '</div></div></div>');
+    return;
+  }
+
+  if (!data || data.error) {
+    let errorHtml = '<div class="error-state">' + escapeHtml(data?.error || "Unable to load voting data") + '</div>';
+    if (data?.raw) {
+      errorHtml += '<div class="error-raw"><strong>Raw:</strong> ' + escapeHtml(data.raw) + '</div>';
+    }
+    setHtml(app, errorHtml);
+    return;
+  }
+
+  const parts = [
+    `<div class="widget-container"><div class="widget-header"><h1 class="widget-title">Voting Record</h1><p class="widget-subtitle">${data.total_votes | 0} recent votes</p></div>`
+  ];
+
+  const votes = data.votes || [];
+
+  // One template literal per division card
+  votes.slice(0, 10).forEach(v => {
+    const isAye = v.vote === "ayes" || v.vote === "aye";
+    const voteColor = isAye ? "#4ade80" : "#f87171";
+    const voteBg = isAye ? "rgba(34, 197, 94, 0.15)" : "rgba(239, 68, 68, 0.15)";
+    const voteText = isAye ? "AYE" : "NO";
+
+    const totalVotes = (v.ayes_count || 0) + (v.noes_count || 0);
+    const ayePct = totalVotes > 0 ? Math.round((v.ayes_count / totalVotes) * 100) : 50;
+    const titleText = (v.title || "Unknown Division").substring(0, 80);
+
+    parts.push(
+      `<div class="status-card status-card-plain">` +
+      `<div class="vote-header">` +
+      `<div class="item-main"><div class="vote-title">${escapeHtml(titleText)}</div>` +
+      `<div class="item-meta">${formatDate(v.date)}</div></div>` +
+      `<span class="vote-badge" style="background:${voteBg};color:${voteColor}">${voteText}</span></div>` +
+      // Vote bar
+      `<div class="vote-split">` +
+      `<span class="vote-ayes">${v.ayes_count || 0}</span>` +
+      `<div class="vote-bar">` +
+      `<div class="vote-bar-ayes" style="width:${ayePct}%"></div><div class="vote-bar-noes" style="width:${100 - ayePct}%"></div></div>` +
+      `<span class="vote-noes">${v.noes_count || 0}</span></div></div>`
+    );
+  });
+
+  parts.push(renderFooter(data, "Commons Votes") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "bike-points": '''<script>
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    let errorHtml = '<div class="error-state">' + escapeHtml(data?.error || "Unable to load bike points") + '</div>';
+    if (data?.raw) {
+      errorHtml += '<div class="error-raw"><strong>Raw:</strong> ' + escapeHtml(data.raw) + '</div>';
+    }
+    setHtml(app, errorHtml);
+    return;
+  }
+
+  const points = data.bike_points || [];
+
+  const parts = ['<div class="widget-container">'];
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">Santander Cycles</h1>');
+  parts.push('<p class="widget-subtitle">' + (data.total_results | 0) + ' docking stations</p>');
+  parts.push('</div>');
+
+  if (points.length > 0) {
+    points.slice(0, 8).forEach(p => {
+      // TfL reports dock counts as integer strings ("12"); missing values become 0
+      const bikes = +p.bikes_available | 0;
+      const empty = +p.empty_docks | 0;
+      const total = (+p.total_docks | 0) || (bikes + empty);
+      const bikePct = total > 0 ? Math.round((bikes / total) * 100) : 0;
+
+      const availColor = bikes > 5 ? "#4ade80" : bikes > 0 ? "#fbbf24" : "#f87171";
+
+      const stationName = (p.name || "Unknown Station").replace("Santander Cycles:", "").trim();
+
+      // One push per docking station card
+      parts.push(
+        `<div class="status-card" style="border-left-color:${availColor}"><div class="status-header">` +
+        `<div class="item-main"><div class="status-name status-name-sm">${escapeHtml(stationName)}</div></div>` +
+        `<div class="item-aside"><div class="bike-count" style="color:${availColor}">${bikes}</div><div class="item-caption">bikes</div></div>` +
+        '</div>' +
+        // Availability bar
+        '<div class="bike-availability"><div class="bike-availability-labels">' +
+        `<span>Bikes: ${bikes}</span><span>Empty: ${empty}</span></div>` +
+        `<div class="score-bar"><div class="score-fill bike-fill" style="width:${bikePct}%"></div></div></div>` +
+        '</div>'
+      );
+    });
+  } else {
+    parts.push('<div class="empty-state"><div class="empty-text">No bike points found</div></div>');
+  }
+
+  parts.push(renderFooter(data, "Transport for London") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "journey-planner": '''<script>
+// Icon and marker colour per TfL mode, keyed by lowercase mode name
+const MODE_STYLES = {
+  "tube": { icon: "🚇", color: "#0019A8" },
+  "bus": { icon: "🚌", color: "#E32017" },
+  "walking": { icon: "🚶", color: "#666" },
+  "overground": { icon: "🚆", color: "#EE7C0E" },
+  "dlr": { icon: "🚈", color: "#00A4A7" },
+  "elizabeth-line": { icon: "🚇", color: "#6950a1" },
+  "national-rail": { icon: "🚂", color: "#333" },
+  "tram": { icon: "🚊", color: "#84B817" },
+  "river-bus": { icon: "⛴️", color: "#666" },
+  "cable-car": { icon: "🚡", color: "#666" }
+};
+const MODE_FALLBACK = { icon: "•", color: "#666" };
+
+// Leg marker markup depends only on the mode, so it is built once per mode
+for (const style of [...Object.values(MODE_STYLES), MODE_FALLBACK]) {
+  style.marker = `<div class="journey-leg-marker" style="border:2px solid ${style.color}">${style.icon}</div>`;
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to plan journey") + '</div>');
+    return;
+  }
+
+  const journeys = data.journey_options || [];
+
+  const parts = ['<div class="widget-container">'];
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">Journey Planner</h1>');
+  parts.push('<p class="widget-subtitle">' + escapeHtml(data.from || "?") + ' → ' + escapeHtml(data.to || "?") + '</p>');
+  parts.push('</div>');
+
+  if (journeys.length > 0) {
+    journeys.slice(0, 3).forEach((j, idx) => {
+      const legs = j.legs || [];
+
+      // Journey header
+      parts.push(
+        '<div class="status-card accent-tfl"><div class="status-header journey-header">' +
+        `<div><div class="item-meta">Option ${idx + 1}</div><div class="journey-duration">${j.duration | 0} mins</div></div>` +
+        `<div class="journey-times">${formatTime(j.start_time)} → ${formatTime(j.arrival_time)}</div>` +
+        '</div><div class="journey-legs">'
+      );
+
+      // Journey legs, one push per leg
+      legs.forEach(leg => {
+        const mode = MODE_STYLES[(leg.mode || "walking").toLowerCase()] || MODE_FALLBACK;
+
+        parts.push(
+          `<div class="journey-leg">${mode.marker}` +
+          '<div class="journey-leg-body">' +
+          `<div><div class="journey-leg-from">${escapeHtml(leg.departure_point || "Start")}</div>` +
+          (leg.instruction ? `<div class="journey-leg-instruction">${escapeHtml(leg.instruction)}</div>` : "") +
+          `</div><span class="journey-leg-duration">${leg.duration || 0} min</span></div></div>`
+        );
+      });
+
+      parts.push('</div></div>');
+    });
+  } else {
+    parts.push('<div class="empty-state"><div class="empty-text">No routes found</div></div>');
+  }
+
+  parts.push(renderFooter(data, "Transport for London") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "road-status": '''<script>
+const STATUS_STYLES = {
+  good: { class: "status-good", badge: "badge-good", color: "#4ade80" },
+  warning: { class: "status-warning", badge: "badge-warning", color: "#fbbf24" },
+  error: { class: "status-error", badge: "badge-error", color: "#f87171" },
+  unknown: { class: "", badge: "", color: "#888" }
+};
+
+function getStatusStyle(severity) {
+  const s = (severity || "").toLowerCase();
+  if (s.includes("good") || s.includes("no")) return STATUS_STYLES.good;
+  if (s.includes("minor") || s.includes("moderate")) return STATUS_STYLES.warning;
+  if (s.includes("serious") || s.includes("severe")) return STATUS_STYLES.error;
+  return STATUS_STYLES.unknown;
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load road status") + '</div>');
+    return;
+  }
+
+  const roads = data.roads || [];
+
+  const parts = ['<div class="widget-container">'];
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">Road Status</h1>');
+  parts.push('<p class="widget-subtitle">' + roads.length + ' road' + (roads.length !== 1 ? 's' : '') + '</p>');
+  parts.push('</div>');
+
+  if (roads.length > 0) {
+    roads.forEach(r => {
+      const style = getStatusStyle(r.status_description);
+
+      parts.push(
+        `<div class="status-card ${style.class}"><div class="status-header">` +
+        `<div><div class="status-name">${escapeHtml(r.display_name || r.id)}</div></div>` +
+        `<span class="status-badge ${style.badge}">${escapeHtml(r.status_description || "Unknown")}</span></div></div>`
+      );
+    });
+  } else {
+    parts.push('<div class="empty-state"><div class="empty-text">No road data available</div></div>');
+  }
+
+  parts.push(renderFooter(data, "Transport for London") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+''',
+    "nhs-services": '''<script>
+function formatDistance(d) {
+  if (!d && d !== 0) return "";
+  const km = parseFloat(d);
+  if (km < 1) {
+    return Math.round(km * 1000) + "m";
+  }
+  return km.toFixed(1) + "km";
+}
+
+window.render = function(data) {
+  const app = document.getElementById("app");
+
+  if (!data || data.error) {
+    setHtml(app, '<div class="error-state">' + escapeHtml(data?.error || "Unable to load NHS services") + '</div>');
+    return;
+  }
+
+  // Find the services array (could be services, hospitals, pharmacies)
+  let services = data.services || data.hospitals || data.pharmacies || [];
+  let serviceType = "Services";
+  if (data.hospitals) serviceType = "Hospitals";
+  if (data.pharmacies) serviceType = "Pharmacies";
+  if (data.services) serviceType = "GP Surgeries";
+
+  const parts = ['<div class="widget-container">'];
+  parts.push('<div class="widget-header">');
+  parts.push('<h1 class="widget-title">NHS ' + escapeHtml(serviceType) + '</h1>');
+  parts.push('<p class="widget-subtitle">Near ' + escapeHtml(data.search_postcode || "your location") + '</p>');
+  parts.push('</div>');
+
+  if (services.length > 0) {
+    services.slice(0, 8).forEach(s => {
+      const addressParts = [s.address, s.city, s.postcode].filter(Boolean).map(p => escapeHtml(p));
+      const hasDistance = s.distance !== undefined && s.distance !== null;
+
+      // One push per service card
+      parts.push(
+        '<div class="status-card accent-nhs"><div class="status-header">' +
+        `<div class="item-main"><div class="status-name status-name-sm">${escapeHtml(s.name || "Unknown")}</div>` +
+        (addressParts.length > 0 ? `<div class="item-address">${addressParts.join(", ")}</div>` : "") +
+        '</div>' +
+        (hasDistance ? `<div class="item-aside"><div class="service-distance">${formatDistance(s.distance)}</div></div>` : "") +
+        '</div>' +
+        (s.phone ? `<div class="service-phone"><span class="service-phone-label">Tel:</span> <span class="service-phone-number">${escapeHtml(s.phone)}</span></div>` : "") +
+        '</div>'
+      );
+    });
+  } else {
+    parts.push('<div class="empty-state"><div class="empty-text">No services found nearby</div></div>');
+  }
+
+  parts.push(renderFooter(data, "NHS") + '</div>');
+
+  setHtml(app, parts.join(''));
+}
+</script>
+'''
+}
+
+
+# Widget sources are kept readable above and trimmed once on import
+WIDGETS = {name: _minify_js(body) for name, body in WIDGETS.items()}
+
+
+def get_widget(name: str) -> Optional[str]:
+    """Return the markup for a widget (loading placeholder plus script).
+
+    Args:
+        name: Widget name, a key of WIDGETS
+
+    Returns:
+        The widget markup, or None if there is no widget with that name
+    """
+    body = WIDGETS.get(name)
+    if body is None:
+        return None
+    return LOADING_SHELL + body
@@ -18,11 +18,22 @@ class MockFastMCP:
     def __init__(self, **kwargs):
         self.name = kwargs.get("name", "test")
         self.instructions = kwargs.get("instructions", "")
+        self.tools = {}
 
-    def tool(self, func):
-        """Decorator that returns the function unchanged."""
+    def tool(self, func=None, **kwargs):
+        """Decorator that records the tool and returns the function unchanged.
+
+        Supports both bare ``@mcp.tool`` and ``@mcp.tool(meta=...)``.
+        """
+        if func is None:
+            return lambda f: self.tool(f, **kwargs)
+        self.tools[func.__name__] = func
         return func
 
+    def resource(self, uri, **kwargs):
+        """Decorator factory that returns the function unchanged."""
+        return lambda f: f
+
     def run(self):
         """Mock run method."""
         pass
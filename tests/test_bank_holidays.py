@@ -0,0 +1,212 @@
+"""Tests for the bank holidays tool.
+
+This module tests get_bank_holidays with mocked API responses, covering
+country filtering and the conditional-GET cache for the holidays feed.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+import pytest
+import requests
+from gov_uk_mcp.tools import bank_holidays
+from gov_uk_mcp.tools.bank_holidays import get_bank_holidays
+
+# Tools fetch through the shared session in gov_uk_mcp.http_client
+SESSION_GET = "gov_uk_mcp.http_client._SESSION.get"
+
+
+@pytest.fixture(autouse=True)
+def clear_bank_holidays_cache():
+    """Start every test with an empty feed cache."""
+    bank_holidays._BH_CACHE.update(etag=None, last_modified=None, payload=None, events=None)
+    yield
+    bank_holidays._BH_CACHE.update(etag=None, last_modified=None, payload=None, events=None)
+
+
+@pytest.fixture
+def sample_bank_holidays_response() -> Dict[str, Any]:
+    """Provide a sample GOV.UK bank holidays document."""
+    return {
+        "england-and-wales": {
+            "division": "england-and-wales",
+            "events": [
+                {"title": "New Year's Day", "date": "2000-01-03"},
+                {"title": "Christmas Day", "date": "2099-12-25"},
+            ],
+        },
+        "scotland": {
+            "division": "scotland",
+            "events": [
+                {"title": "St Andrew's Day", "date": "2099-11-30"},
+            ],
+        },
+    }
+
+
+def _response(status_code: int, payload: Any = None, headers: Dict[str, str] = None) -> Mock:
+    """Build a mock requests.Response."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = headers or {}
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode() if payload is not None else b""
+    mock_response.raise_for_status = Mock()
+    return mock_response
+
+
+class TestGetBankHolidays:
+    """Test bank holiday retrieval and filtering."""
+
+    def test_country_filter_returns_upcoming_only(
+        self, sample_bank_holidays_response: Dict[str, Any]
+    ):
+        """Past holidays are dropped for the requested country."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response)
+
+            result = asyncio.run(get_bank_holidays("England and Wales"))
+
+        assert result["country"] == "england-and-wales"
+        assert [h["title"] for h in result["upcoming_holidays"]] == ["Christmas Day"]
+
+    def test_all_countries(self, sample_bank_holidays_response: Dict[str, Any]):
+        """Without a country, every division is returned."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response)
+
+            result = asyncio.run(get_bank_holidays())
+
+        assert result["scotland"]["upcoming_holidays"][0]["title"] == "St Andrew's Day"
+        assert len(result["england-and-wales"]["upcoming_holidays"]) == 1
+
+    def test_upcoming_sorted_by_date(self):
+        """Upcoming holidays come back in date order even if the feed is not."""
+        feed = {
+            "scotland": {
+                "division": "scotland",
+                "events": [
+                    {"title": "Later", "date": "2099-12-26"},
+                    {"title": "Past", "date": "2000-01-01"},
+                    {"title": "Sooner", "date": "2099-01-02"},
+                ],
+            }
+        }
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, feed)
+
+            result = asyncio.run(get_bank_holidays("scotland"))
+
+        assert [h["title"] for h in result["upcoming_holidays"]] == ["Sooner", "Later"]
+        assert [e["title"] for e in feed["scotland"]["events"]] == ["Later", "Past", "Sooner"]
+
+    def test_invalid_country(self, sample_bank_holidays_response: Dict[str, Any]):
+        """An unknown country returns an error listing the valid ones."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response)
+
+            result = asyncio.run(get_bank_holidays("wales"))
+
+        assert "error" in result
+        assert "england-and-wales" in result["error"]
+
+    def test_network_error(self):
+        """Network errors are sanitized."""
+        with patch(SESSION_GET, side_effect=requests.ConnectionError("boom")):
+            result = asyncio.run(get_bank_holidays())
+
+        assert "error" in result
+
+    def test_invalid_json(self):
+        """A body that is not JSON is reported as an error, not raised."""
+        bad = _response(200)
+        bad.content = b"<html>Service unavailable</html>"
+        bad.json.side_effect = requests.JSONDecodeError("Expecting value", "<html>", 0)
+        with patch(SESSION_GET, return_value=bad):
+            result = asyncio.run(get_bank_holidays())
+
+        assert "error" in result
+
+
+class TestBankHolidaysCache:
+    """Test conditional-GET revalidation of the holidays feed."""
+
+    def test_first_fetch_is_unconditional(self, sample_bank_holidays_response: Dict[str, Any]):
+        """Nothing is cached yet, so no validators are sent."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response, {"ETag": '"abc"'})
+
+            asyncio.run(get_bank_holidays())
+
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+    def test_not_modified_reuses_cached_payload(
+        self, sample_bank_holidays_response: Dict[str, Any]
+    ):
+        """A 304 is answered from the cached document."""
+        headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response, headers)
+            first = asyncio.run(get_bank_holidays("scotland"))
+
+            not_modified = _response(304)
+            mock_get.return_value = not_modified
+            second = asyncio.run(get_bank_holidays("scotland"))
+
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"abc"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        not_modified.json.assert_not_called()
+        assert second["upcoming_holidays"] == first["upcoming_holidays"]
+
+    def test_not_modified_updates_validators(self, sample_bank_holidays_response: Dict[str, Any]):
+        """Validators sent with a 304 replace the stored ones."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(
+                200,
+                sample_bank_holidays_response,
+                {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+            asyncio.run(get_bank_holidays())
+
+            mock_get.return_value = _response(304, headers={"ETag": '"v1-gzip"'})
+            asyncio.run(get_bank_holidays())
+            asyncio.run(get_bank_holidays())
+
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1-gzip"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_mutating_result_does_not_change_cache(
+        self, sample_bank_holidays_response: Dict[str, Any]
+    ):
+        """Changes a caller makes to returned events never reach the cache."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response, {"ETag": '"v1"'})
+            first = asyncio.run(get_bank_holidays("scotland"))
+            first["upcoming_holidays"][0]["title"] = "Changed"
+            first["upcoming_holidays"].clear()
+
+            mock_get.return_value = _response(304)
+            second = asyncio.run(get_bank_holidays("scotland"))
+
+        assert second["upcoming_holidays"] == [{"title": "St Andrew's Day", "date": "2099-11-30"}]
+
+    def test_changed_document_replaces_cache(self, sample_bank_holidays_response: Dict[str, Any]):
+        """A 200 on revalidation stores the new document and validators."""
+        updated = {
+            "scotland": {
+                "division": "scotland",
+                "events": [{"title": "Extra Holiday", "date": "2099-06-01"}],
+            }
+        }
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, sample_bank_holidays_response, {"ETag": '"v1"'})
+            asyncio.run(get_bank_holidays())
+
+            mock_get.return_value = _response(200, updated, {"ETag": '"v2"'})
+            result = asyncio.run(get_bank_holidays("scotland"))
+
+        assert result["upcoming_holidays"][0]["title"] == "Extra Holiday"
+        assert bank_holidays._BH_CACHE["etag"] == '"v2"'
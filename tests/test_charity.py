@@ -0,0 +1,197 @@
+"""Tests for Charity Commission lookup tools.
+
+This module tests charity number and search query validation, and the
+result caches for get_charity and search_charities.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+import pytest
+import requests
+from gov_uk_mcp.tools import charity
+from gov_uk_mcp.tools.charity import (
+    _validate_charity_number,
+    _validate_search_query,
+    get_charity,
+    search_charities,
+)
+from gov_uk_mcp.validation import ValidationError
+
+# Tools fetch through the shared session in gov_uk_mcp.http_client
+SESSION_GET = "gov_uk_mcp.http_client._SESSION.get"
+
+
+@pytest.fixture(autouse=True)
+def clear_charity_caches():
+    """Start every test with empty result caches."""
+    charity._CHARITY_CACHE.clear()
+    charity._SEARCH_CACHE.clear()
+    yield
+    charity._CHARITY_CACHE.clear()
+    charity._SEARCH_CACHE.clear()
+
+
+def _response(status_code: int, payload: Dict[str, Any] = None) -> Mock:
+    """Build a mock requests.Response."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode()
+    if status_code >= 400:
+        mock_response.raise_for_status = Mock(
+            side_effect=requests.HTTPError(response=mock_response)
+        )
+    else:
+        mock_response.raise_for_status = Mock()
+    return mock_response
+
+
+class TestValidateCharityNumber:
+    """Test charity registration number validation."""
+
+    @pytest.mark.parametrize(
+        "number,expected",
+        [
+            ("1234567", "1234567"),
+            ("  202918 ", "202918"),
+            ("sc012345", "SC012345"),
+            ("NIC100001", "NIC100001"),
+            ("1234567-1", "1234567-1"),
+        ],
+    )
+    def test_valid_numbers(self, number: str, expected: str):
+        """Valid formats are normalised to upper case without whitespace."""
+        assert _validate_charity_number(number) == expected
+
+    @pytest.mark.parametrize("number", ["12345", "123456789", "SC12345", "AB123456", "1234567-"])
+    def test_invalid_format(self, number: str):
+        """Numbers outside the accepted formats are rejected."""
+        with pytest.raises(ValidationError, match="Invalid charity number format"):
+            _validate_charity_number(number)
+
+    def test_empty(self):
+        """An empty number is rejected before any other check."""
+        with pytest.raises(ValidationError, match="required"):
+            _validate_charity_number("")
+
+    def test_too_long(self):
+        """The length check runs before the format check."""
+        with pytest.raises(ValidationError, match="too long"):
+            _validate_charity_number("1" * 16)
+
+
+class TestValidateSearchQuery:
+    """Test charity search query validation."""
+
+    def test_strips_whitespace(self):
+        """Surrounding whitespace is removed."""
+        assert _validate_search_query("  Oxfam  ") == "Oxfam"
+
+    @pytest.mark.parametrize(
+        "query,message", [("", "required"), (" a ", "at least 2"), ("x" * 201, "200")]
+    )
+    def test_invalid(self, query: str, message: str):
+        """Empty, too short and too long queries are rejected."""
+        with pytest.raises(ValidationError, match=message):
+            _validate_search_query(query, "Charity name")
+
+
+class TestCharityCaches:
+    """Test the TTL caches in front of the Charity Commission API."""
+
+    def test_get_charity_repeat_is_cached(self):
+        """A second lookup of the same number skips the API."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(
+                200, {"charityNumber": 202918, "charityName": "Oxfam"}
+            )
+            first = asyncio.run(get_charity("202918"))
+            second = asyncio.run(get_charity(" 202918 "))
+
+        assert mock_get.call_count == 1
+        assert "cached" not in first
+        assert second.pop("cached") is True
+        assert second == first
+        assert first["charity_name"] == "Oxfam"
+
+    def test_mutating_result_does_not_change_cache(self):
+        """Changes a caller makes to a result never reach later hits."""
+        payload = {"charityName": "Oxfam", "trustees": [{"name": "A"}]}
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, payload)
+            first = asyncio.run(get_charity("202918"))
+            first["charity_name"] = "Changed"
+            first["trustees"].append({"name": "B"})
+
+            second = asyncio.run(get_charity("202918"))
+            second["trustees"][0]["name"] = "Changed"
+
+            third = asyncio.run(get_charity("202918"))
+
+        assert third["charity_name"] == "Oxfam"
+        assert third["trustees"] == [{"name": "A"}]
+
+    def test_mutating_search_result_does_not_change_cache(self):
+        """Nested charity entries in a cached search are copied too."""
+        payload = {"charities": [{"charityNumber": 202918, "charityName": "Oxfam"}], "count": 1}
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, payload)
+            first = asyncio.run(search_charities("Oxfam"))
+            first["charities"][0]["charity_name"] = "Changed"
+            first["charities"].clear()
+
+            second = asyncio.run(search_charities("Oxfam"))
+
+        assert second["cached"] is True
+        assert second["charities"][0]["charity_name"] == "Oxfam"
+
+    def test_get_charity_errors_not_cached(self):
+        """Not-found and server errors are fetched again next time."""
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(404, {})
+            assert asyncio.run(get_charity("202918")) == {"error": "Charity not found"}
+
+            mock_get.return_value = _response(503, {})
+            assert "error" in asyncio.run(get_charity("202918"))
+
+            mock_get.return_value = _response(200, {"charityName": "Oxfam"})
+            assert asyncio.run(get_charity("202918"))["charity_name"] == "Oxfam"
+
+        assert mock_get.call_count == 3
+
+    def test_get_charity_entry_expires(self, monkeypatch: pytest.MonkeyPatch):
+        """Entries older than the TTL are fetched again."""
+        now = [1000.0]
+        monkeypatch.setattr(charity.time, "monotonic", lambda: now[0])
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, {"charityName": "Oxfam"})
+            asyncio.run(get_charity("202918"))
+            now[0] += charity._CACHE_TTL + 1
+            asyncio.run(get_charity("202918"))
+
+        assert mock_get.call_count == 2
+
+    def test_search_cache_ignores_case(self):
+        """Searches differing only in case share a cache entry."""
+        payload = {"charities": [{"charityNumber": 202918, "charityName": "Oxfam"}], "count": 1}
+        with patch(SESSION_GET) as mock_get:
+            mock_get.return_value = _response(200, payload)
+            asyncio.run(search_charities("Oxfam"))
+            result = asyncio.run(search_charities("OXFAM"))
+
+        assert mock_get.call_count == 1
+        assert result["charities"][0]["charity_name"] == "Oxfam"
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache stays within maxsize, dropping the oldest entry."""
+        cache = charity._TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
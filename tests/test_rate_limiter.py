@@ -1,18 +1,23 @@
 """Tests for rate limiter implementation."""
 
+import asyncio
+import math
 import time
 import pytest
 import threading
 from datetime import datetime
 from gov_uk_mcp.rate_limiter import (
     RateLimiter,
+    RateLimitInfo,
     TokenBucket,
     rate_limit,
+    rate_limit_async,
     get_limiter,
     check_mot_limit,
     check_companies_house_limit,
     check_tfl_limit,
     check_default_limit,
+    _retry_after_seconds,
 )
 
 
@@ -26,6 +31,13 @@ class TestTokenBucket:
         assert bucket.tokens == 100
         assert bucket.rate == 10
 
+    def test_bucket_uses_slots(self):
+        """Test buckets carry no per-instance __dict__."""
+        bucket = TokenBucket(capacity=100, tokens=100, rate=10)
+        assert not hasattr(bucket, "__dict__")
+        with pytest.raises(AttributeError):
+            bucket.unexpected = 1
+
     def test_consume_tokens_success(self):
         """Test successful token consumption."""
         bucket = TokenBucket(capacity=100, tokens=100, rate=10)
@@ -73,6 +85,99 @@ class TestTokenBucket:
 
         assert available_before == available_after == 50
 
+    def test_consume_skips_refill_below_one_token(self):
+        """Test consume only refills once a whole token could have accrued."""
+        bucket = TokenBucket(capacity=60, tokens=60, rate=1)
+        refill_times = set()
+
+        for _ in range(10):
+            success, _, _ = bucket.consume(1)
+            assert success is True
+            refill_times.add(bucket.last_refill)
+            time.sleep(0.01)
+
+        assert len(refill_times) <= 2
+        assert bucket.tokens == 50
+
+    def test_fast_polling_drained_bucket_is_not_starved(self, monkeypatch):
+        """Test polling faster than one millitoken accrues still earns a token."""
+        from gov_uk_mcp import rate_limiter
+
+        clock = [10 * 60 * 1_000_000_000]
+        monkeypatch.setattr(rate_limiter, "_monotonic_ns", lambda: clock[0])
+        bucket = TokenBucket(capacity=10, tokens=0, rate=10 / 60.0)
+
+        # 10 req/min accrues one millitoken every 6 ms, so a 1 ms poll never
+        # sees a whole millitoken accrue between two calls
+        granted_at = None
+        for poll in range(1, 10_001):
+            clock[0] += 1_000_000
+            if bucket.consume(1)[0]:
+                granted_at = poll
+                break
+
+        assert granted_at == 6000
+
+    def test_state_is_integer_millitokens(self):
+        """Test bucket state holds integer millitokens with exact refill."""
+        six_seconds_ago = time.monotonic_ns() - 6_000_000_000
+        bucket = TokenBucket(capacity=10, tokens=0, rate=10 / 60.0, last_refill=six_seconds_ago)
+
+        assert bucket._state[0] == 0
+        assert isinstance(bucket._rate_milli, int)
+
+        # 10 req/min accrues exactly one token in six seconds
+        available, _ = bucket.peek()
+        assert available == 1.0
+
+    def test_last_refill_uses_monotonic_clock(self):
+        """Test refill timestamps come from the monotonic nanosecond clock."""
+        before = time.monotonic_ns()
+        bucket = TokenBucket(capacity=100, tokens=100, rate=10)
+        bucket.consume(1)
+
+        assert isinstance(bucket.last_refill, int)
+        assert before <= bucket.last_refill <= time.monotonic_ns()
+
+    def test_peek_does_not_publish_refill(self):
+        """Test peek reads a snapshot without writing bucket state."""
+        bucket = TokenBucket(capacity=100, tokens=50, rate=10)
+        state_before = bucket._state
+
+        time.sleep(0.1)
+        available, _ = bucket.peek()
+
+        assert available > 50
+        assert bucket._state is state_before
+
+    def test_reset_refills_to_capacity(self):
+        """Test bucket reset restores full capacity."""
+        bucket = TokenBucket(capacity=100, tokens=10, rate=10)
+        bucket.reset()
+
+        assert bucket.tokens == 100
+        assert bucket.lock.locked() is False
+
+    def test_reset_waits_for_in_flight_consume(self):
+        """Test reset serialises with consume so it cannot be overwritten."""
+        bucket = TokenBucket(capacity=100, tokens=10, rate=10)
+        done = threading.Event()
+
+        def do_reset():
+            bucket.reset()
+            done.set()
+
+        with bucket.lock:
+            thread = threading.Thread(target=do_reset)
+            thread.start()
+            # A consume holding the lock must finish before the reset lands
+            assert done.wait(0.1) is False
+            bucket._state = (0, bucket._state[1])
+
+        thread.join(1)
+        assert done.is_set()
+        assert bucket.tokens == 100
+
     def test_concurrent_consumption(self):
         """Test thread-safe concurrent token consumption."""
         bucket = TokenBucket(capacity=100, tokens=100, rate=10)
@@ -100,7 +205,19 @@ class TestRateLimiter:
     def test_rate_limiter_initialization(self):
         """Test rate limiter initializes correctly."""
         limiter = RateLimiter()
-        assert limiter._buckets == {}
+        assert len(limiter._shards) == RateLimiter._NUM_SHARDS
+        assert all(shard == {} for shard in limiter._shards)
+
+    def test_buckets_are_stored_in_endpoint_shard(self):
+        """Test each bucket lives in the shard chosen by its endpoint hash."""
+        limiter = RateLimiter()
+        for i in range(100):
+            limiter.check_limit(f"endpoint_{i}", requests_per_minute=60)
+
+        assert sum(len(shard) for shard in limiter._shards) == 100
+        for index, shard in enumerate(limiter._shards):
+            for endpoint in shard:
+                assert limiter._shard_index(endpoint) == index
 
     def test_check_limit_creates_bucket(self):
         """Test check_limit creates bucket on first call."""
@@ -157,6 +274,64 @@ class TestRateLimiter:
         assert info["retry_after"] > 0
         assert info["remaining"] == 0
 
+    def test_check_limit_info_formats_reset_time_lazily(self):
+        """Test reset_time is only formatted when read."""
+        limiter = RateLimiter()
+        allowed, info = limiter.check_limit("lazy", requests_per_minute=60)
+
+        assert isinstance(info, RateLimitInfo)
+        assert "reset_time" in info
+        assert info._reset_iso is None
+
+        reset_time = info["reset_time"]
+        datetime.fromisoformat(reset_time)
+        assert info._reset_iso == reset_time
+
+    def test_check_limit_info_behaves_like_dict(self):
+        """Test info supports the dictionary access patterns callers use."""
+        limiter = RateLimiter()
+        allowed, info = limiter.check_limit("dictlike", requests_per_minute=1)
+
+        assert set(info) == {"remaining", "reset_time", "limit"}
+        assert info.get("retry_after", 60) == 60
+        assert dict(info)["limit"] == 1
+
+        allowed, info = limiter.check_limit("dictlike", requests_per_minute=1)
+        assert allowed is False
+        assert set(info) == {"remaining", "reset_time", "limit", "retry_after"}
+        with pytest.raises(KeyError):
+            info["missing"]
+
+    def test_check_limit_fast_returns_raw_tuple(self):
+        """Test check_limit_fast returns plain values instead of a mapping."""
+        limiter = RateLimiter()
+        allowed, remaining, reset_time, limit, wait_ns = limiter.check_limit_fast(
+            "fast", requests_per_minute=60
+        )
+
+        assert allowed is True
+        assert remaining == 59
+        assert limit == 60
+        assert reset_time >= time.time()
+        assert wait_ns == 0
+
+    def test_retry_after_is_ceiling_of_wait(self):
+        """Test retry_after is the exact wait rounded up to whole seconds."""
+        limiter = RateLimiter()
+        limiter.check_limit("ceil", requests_per_minute=30, tokens=30)
+
+        allowed, _, _, _, wait_ns = limiter.check_limit_fast("ceil", requests_per_minute=30)
+        assert allowed is False
+        assert 0 < wait_ns <= 2_000_000_000
+        assert _retry_after_seconds(wait_ns) == math.ceil(wait_ns / 1e9)
+
+        allowed, info = limiter.check_limit("ceil", requests_per_minute=30)
+        assert info["retry_after"] == 2
+
+        # Exactly one second must not be rounded up to two
+        assert _retry_after_seconds(1_000_000_000) == 1
+        assert _retry_after_seconds(1_000_000_001) == 2
+
     def test_get_status(self):
         """Test get_status returns current limit status."""
         limiter = RateLimiter()
@@ -179,6 +354,18 @@ class TestRateLimiter:
         assert status["available"] == 60  # Default limit
         assert status["limit"] == 60
 
+    def test_get_status_full_bucket_reuses_cached_timestamp(self):
+        """Test full buckets report the cached current-second timestamp."""
+        limiter = RateLimiter()
+        limiter.check_limit("full", requests_per_minute=60)
+        limiter.reset("full")
+
+        status = limiter.get_status("full")
+
+        assert status["available"] == 60
+        # Cached per second, so no sub-second component
+        assert datetime.fromisoformat(status["reset_time"]).microsecond == 0
+
     def test_reset_specific_endpoint(self):
         """Test reset for specific endpoint."""
         limiter = RateLimiter()
@@ -230,6 +417,84 @@ class TestRateLimiter:
         # Exactly 50 should succeed
         assert sum(results) == 50
 
+    def test_concurrent_bucket_creation_returns_single_bucket(self):
+        """Test racing first calls for an endpoint share one bucket."""
+        limiter = RateLimiter()
+        buckets = []
+
+        def get_bucket():
+            buckets.append(limiter._get_bucket("race_test", 60))
+
+        threads = [threading.Thread(target=get_bucket) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(bucket) for bucket in buckets}) == 1
+
+    def test_check_limit_debits_weighted_tokens(self):
+        """Test check_limit debits a burst of tokens in one call."""
+        limiter = RateLimiter()
+        allowed, info = limiter.check_limit("batch", requests_per_minute=10, tokens=5)
+
+        assert allowed is True
+        assert info["remaining"] == 5
+
+    def test_check_limit_weighted_is_all_or_nothing(self):
+        """Test a weighted check_limit rejects without a partial debit."""
+        limiter = RateLimiter()
+        limiter.check_limit("batch", requests_per_minute=10, tokens=8)
+
+        allowed, info = limiter.check_limit("batch", requests_per_minute=10, tokens=5)
+
+        assert allowed is False
+        assert info["remaining"] == 2
+        assert "retry_after" in info
+
+    def test_idle_full_buckets_are_evicted(self):
+        """Test idle buckets that have refilled are swept from their shard."""
+        limiter = RateLimiter(idle_ttl=0.05)
+        limiter.check_limit("idle", requests_per_minute=6000)
+        shard = limiter._shards[limiter._shard_index("idle")]
+
+        time.sleep(0.1)
+        limiter._evict_idle(shard)
+
+        assert "idle" not in shard
+
+    def test_idle_buckets_below_capacity_are_kept(self):
+        """Test buckets still refilling are not evicted."""
+        limiter = RateLimiter(idle_ttl=0.05)
+        limiter.check_limit("draining", requests_per_minute=1)
+        shard = limiter._shards[limiter._shard_index("draining")]
+
+        time.sleep(0.1)
+        limiter._evict_idle(shard)
+
+        assert "draining" in shard
+
+    def test_default_endpoints_are_never_evicted(self):
+        """Test buckets for named API endpoints are kept."""
+        limiter = RateLimiter(idle_ttl=0)
+        limiter.check_limit("tfl")
+        shard = limiter._shards[limiter._shard_index("tfl")]
+
+        limiter.reset("tfl")
+        limiter._evict_idle(shard)
+
+        assert "tfl" in shard
+
+    def test_eviction_sweep_runs_on_bucket_creation(self):
+        """Test creating buckets periodically sweeps idle ones."""
+        limiter = RateLimiter(idle_ttl=0)
+        for i in range(RateLimiter._NUM_SHARDS * RateLimiter._SWEEP_INTERVAL * 2):
+            limiter.check_limit(f"user_{i}", requests_per_minute=60)
+            limiter.reset(f"user_{i}")
+
+        total = sum(len(shard) for shard in limiter._shards)
+        assert total < RateLimiter._NUM_SHARDS * RateLimiter._SWEEP_INTERVAL * 2
+
     def test_separate_endpoint_limits(self):
         """Test different endpoints have independent limits."""
         limiter = RateLimiter()
@@ -306,6 +571,31 @@ class TestRateLimitDecorator:
         assert result["arg2"] == "value2"
         assert result["kwarg1"] == "kwvalue"
 
+    def test_decorator_with_fixed_weight(self):
+        """Test decorator consumes the configured weight per call."""
+        limiter = RateLimiter()
+
+        @rate_limit("test", requests_per_minute=10, limiter=limiter, weight=4)
+        def test_function():
+            return {"status": "success"}
+
+        assert test_function()["rate_limit"]["remaining"] == 6
+        assert test_function()["rate_limit"]["remaining"] == 2
+        assert test_function()["error_type"] == "rate_limit_exceeded"
+
+    def test_decorator_with_callable_weight(self):
+        """Test decorator derives weight from the call arguments."""
+        limiter = RateLimiter()
+
+        @rate_limit("test", requests_per_minute=10, limiter=limiter, weight=lambda items: len(items))
+        def test_function(items):
+            return {"count": len(items)}
+
+        result = test_function(["a", "b", "c"])
+
+        assert result["count"] == 3
+        assert result["rate_limit"]["remaining"] == 7
+
     def test_decorator_error_response_format(self):
         """Test decorator error response has correct format."""
         limiter = RateLimiter()
@@ -328,6 +618,136 @@ class TestRateLimitDecorator:
         assert "message" in error
 
 
+class TestAsyncRateLimit:
+    """Test cases for try_wait and the rate_limit_async decorator."""
+
+    def test_try_wait_returns_none_when_allowed(self):
+        """Test try_wait returns None when tokens are available."""
+        limiter = RateLimiter()
+        assert limiter.try_wait("wait_test", requests_per_minute=60) is None
+
+    def test_try_wait_returns_wait_when_rejected(self):
+        """Test try_wait returns the time until a token is available."""
+        limiter = RateLimiter()
+        limiter.try_wait("wait_test", requests_per_minute=1)
+
+        wait = limiter.try_wait("wait_test", requests_per_minute=1)
+
+        assert wait is not None
+        assert 0 < wait <= 60
+
+    def test_try_wait_rejects_more_than_capacity(self):
+        """Test try_wait raises instead of returning a wait that can never end."""
+        limiter = RateLimiter()
+
+        with pytest.raises(ValueError, match="capacity"):
+            limiter.try_wait("wait_test", n=100, requests_per_minute=10)
+
+        assert limiter.get_status("wait_test")["available"] == 10
+
+    def test_async_decorator_allows_request(self):
+        """Test async decorator calls through and annotates the result."""
+        limiter = RateLimiter()
+
+        @rate_limit_async("test", requests_per_minute=60, limiter=limiter)
+        async def test_function():
+            return {"status": "success"}
+
+        result = asyncio.run(test_function())
+
+        assert result["status"] == "success"
+        assert result["rate_limit"]["remaining"] == 59
+
+    def test_async_decorator_sleeps_and_retries(self, monkeypatch):
+        """Test async decorator waits for the bucket before retrying."""
+        limiter = RateLimiter()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            limiter.reset("test")
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        @rate_limit_async("test", requests_per_minute=1, limiter=limiter)
+        async def test_function():
+            return {"status": "success"}
+
+        asyncio.run(test_function())
+        result = asyncio.run(test_function())
+
+        assert result["status"] == "success"
+        assert len(sleeps) == 1
+        assert sleeps[0] > 0
+
+    def test_async_decorator_gives_up_after_max_retries(self, monkeypatch):
+        """Test async decorator returns the error dict once retries run out."""
+        limiter = RateLimiter()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        @rate_limit_async("test", requests_per_minute=1, limiter=limiter, max_retries=2)
+        async def test_function():
+            return {"status": "success"}
+
+        asyncio.run(test_function())
+        result = asyncio.run(test_function())
+
+        assert result["error_type"] == "rate_limit_exceeded"
+        assert len(sleeps) == 2
+
+    def test_async_decorator_weight_over_capacity_fails_fast(self, monkeypatch):
+        """Test a weight above the bucket capacity is rejected without sleeping."""
+        limiter = RateLimiter()
+        sleeps = []
+        calls = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        @rate_limit_async("test", requests_per_minute=10, limiter=limiter, weight=20)
+        async def test_function():
+            calls.append(1)
+            return {"status": "success"}
+
+        result = asyncio.run(test_function())
+
+        assert result["error_type"] == "rate_limit_exceeded"
+        assert sleeps == []
+        assert calls == []
+
+    def test_async_decorator_rejects_negative_max_retries(self):
+        """Test a negative max_retries fails when the decorator is created."""
+        with pytest.raises(ValueError, match="max_retries"):
+            rate_limit_async("test_endpoint", max_retries=-1)
+
+    def test_async_decorator_zero_retries_fails_fast(self, monkeypatch):
+        """Test max_retries=0 returns the rate limit error without sleeping."""
+        limiter = RateLimiter()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        @rate_limit_async("test_endpoint", requests_per_minute=1, limiter=limiter, max_retries=0)
+        async def test_function():
+            return {"data": "success"}
+
+        asyncio.run(test_function())
+        result = asyncio.run(test_function())
+
+        assert "error" in result
+        assert sleeps == []
+
+
 class TestConvenienceFunctions:
     """Test cases for convenience functions."""
 
@@ -356,6 +776,16 @@ class TestConvenienceFunctions:
         assert allowed is True
         assert info["limit"] == 500
 
+    def test_convenience_checks_share_global_buckets(self):
+        """Test convenience checks debit the same bucket as check_limit."""
+        limiter = get_limiter()
+        limiter.reset()
+
+        check_mot_limit()
+        allowed, info = limiter.check_limit("mot_api")
+
+        assert info["remaining"] == 118
+
     def test_check_default_limit(self):
         """Test default limit check."""
         get_limiter().reset()
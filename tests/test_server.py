@@ -0,0 +1,53 @@
+"""Tests for server module wiring.
+
+This module checks that importing gov_uk_mcp.server registers the tool
+catalogue with the mcp instance, without going through main(), and that
+the .env file is loaded unless GOV_UK_MCP_LOAD_DOTENV=0.
+"""
+
+import sys
+from unittest.mock import patch
+import pytest
+from gov_uk_mcp import server
+
+
+class TestToolRegistration:
+    """Test tools are registered when the server module is imported."""
+
+    def test_importing_server_imports_every_tool_module(self):
+        """Every listed tool module is loaded by the import alone."""
+        for name in server._TOOL_MODULES:
+            assert f"gov_uk_mcp.tools.{name}" in sys.modules
+
+    def test_mcp_exposes_tool_catalogue(self):
+        """server.mcp carries tools from across the tool modules."""
+        expected = {
+            "lookup_postcode",
+            "get_bank_holidays",
+            "search_charities",
+            "get_charity",
+            "find_mp",
+            "get_voting_record",
+        }
+
+        assert expected <= set(server.mcp.tools)
+
+
+class TestLoadEnvFile:
+    """Test the .env loading done when the server module is imported."""
+
+    def test_loads_dotenv_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Without the flag the .env file is loaded."""
+        monkeypatch.delenv("GOV_UK_MCP_LOAD_DOTENV", raising=False)
+        with patch("dotenv.load_dotenv") as mock_load:
+            server._load_env_file()
+
+        mock_load.assert_called_once_with()
+
+    def test_flag_skips_dotenv(self, monkeypatch: pytest.MonkeyPatch):
+        """GOV_UK_MCP_LOAD_DOTENV=0 skips the .env file."""
+        monkeypatch.setenv("GOV_UK_MCP_LOAD_DOTENV", "0")
+        with patch("dotenv.load_dotenv") as mock_load:
+            server._load_env_file()
+
+        mock_load.assert_not_called()
@@ -0,0 +1,72 @@
+"""Tests for the inline widget sources."""
+
+from gov_uk_mcp.widgets_inline import (
+    LOADING_SHELL,
+    WIDGET_STYLES,
+    WIDGETS,
+    _minify_css,
+    _minify_js,
+    get_widget,
+)
+
+
+class TestMinifyCss:
+    """Test cases for the stylesheet minifier."""
+
+    def test_strips_comments_and_whitespace(self):
+        """Test comments and whitespace around punctuation are removed."""
+        css = """
+/* Theme */
+.card,
+.panel {
+  color: #fff;
+  padding: 4px 8px;
+}
+"""
+        assert _minify_css(css) == ".card,.panel{color: #fff;padding: 4px 8px}"
+
+    def test_preserves_significant_spaces(self):
+        """Test spaces inside values and selectors are kept."""
+        css = ".a .b { font-family: 'Segoe UI'; width: calc(200px + 100%); }"
+        assert _minify_css(css) == ".a .b{font-family: 'Segoe UI';width: calc(200px + 100%)}"
+
+    def test_widget_styles_are_minified(self):
+        """Test the shipped stylesheet has no comments or newlines."""
+        assert "/*" not in WIDGET_STYLES
+        assert "\n" not in WIDGET_STYLES
+        assert WIDGET_STYLES.count("{") == WIDGET_STYLES.count("}")
+        assert WIDGETS
+
+
+class TestMinifyJs:
+    """Test cases for the widget script trimmer."""
+
+    def test_strips_indentation_and_comment_lines(self):
+        """Test indentation, blank lines and whole-line comments are dropped."""
+        js = """<script>
+// Helper
+function f(a) {
+
+  const url = 'http://example.com'; // kept
+  return a;
+}
+</script>
+"""
+        assert _minify_js(js) == (
+            "<script>\nfunction f(a) {\nconst url = 'http://example.com'; // kept\n"
+            "return a;\n}\n</script>"
+        )
+
+
+class TestGetWidget:
+    """Test cases for widget markup lookup."""
+
+    def test_prepends_loading_shell(self):
+        """Test every widget is served with the shared loading placeholder."""
+        for name, body in WIDGETS.items():
+            assert LOADING_SHELL not in body
+            assert get_widget(name) == LOADING_SHELL + body
+
+    def test_unknown_widget(self):
+        """Test unknown widget names return None."""
+        assert get_widget("no-such-widget") is None